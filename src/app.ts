@@ -1,4 +1,5 @@
 import express, { Application } from 'express';
+import 'express-async-errors';
 import http from 'http';
 import { Routes } from './routes';
 import { config } from './config';
@@ -12,9 +13,13 @@ import { TYPES } from './core/di/types';
 import { deviceInfoMiddleware } from './middleware/request-device-info.middlware';
 import cookieParser from 'cookie-parser';
 import { getMongoConnection } from './utils/mongoConnection';
+import { PDFService } from './services/pdf/pdf.service';
 
 const logger = new WinstonLogger('App');
 
+// The container keeps App as a singleton, but test suites may build several; only hook the signals once
+let signalHandlersRegistered = false;
+
 @injectable()
 export class App {
   private app: Application;
@@ -22,17 +27,28 @@ export class App {
 
   constructor(
     @inject(TYPES.Routes) private readonly routes: Routes,
-    @inject('Application') private readonly expressApp: Application
+    @inject('Application') private readonly expressApp: Application,
+    @inject(TYPES.PDFService) private readonly pdfService: PDFService
   ) {
     this.app = this.expressApp;
     this.setupMiddleware();
     this.initializeRoutes();
     this.setupErrorHandling();
+    this.registerSignalHandlers();
+  }
+
+  private registerSignalHandlers(): void {
+    if (signalHandlersRegistered) {
+      return;
+    }
+    signalHandlersRegistered = true;
     process.on('SIGTERM', () => this.shutdown());
     process.on('SIGINT', () => this.shutdown());
   }
 
   private setupMiddleware(): void {
+    // Responses are per-request (tokens, health, generated PDFs); hashing each body for an ETag is wasted work
+    this.app.set('etag', false);
     this.app.use(requestId);
     this.app.use(deviceInfoMiddleware);
     this.app.use(requestLogger);
@@ -86,5 +102,6 @@ export class App {
 
       await getMongoConnection().disconnect();
     }
+    await this.pdfService.close();
   }
 }
\ No newline at end of file
@@ -4,6 +4,16 @@ import path = require('path');
 
 dotenv.config();
 
+const parseList = (value: string | undefined, fallback: string[]): string[] => {
+  const items = value?.split(',').map((item) => item.trim()).filter(Boolean);
+
+  return items && items.length ? items : fallback;
+};
+
+// Only an unset or empty variable falls back; an explicit 0 is kept, since the driver reads it as "no limit"
+const parseNumber = (value: string | undefined, fallback: number): number =>
+  value !== undefined && value.trim() !== '' ? Number(value) : fallback;
+
 const getConfig = (): IConfig => ({
   port: Number(process.env.PORT) || 3000,
   nodeEnv: process.env.NODE_ENV || 'development',
@@ -12,13 +22,18 @@ const getConfig = (): IConfig => ({
   appName: process.env.APP_NAME || 'api-gateway',
   baseUrl: process.env.BASE_URL || '',
   logLevel: process.env.LOG_LEVEL || 'info',
-  corsOrigins: process.env.CORS_ORIGINS?.split(',') || ['*'],
+  corsOrigins: parseList(process.env.CORS_ORIGINS, ['*']),
   cookieSecret: process.env.COOKIE_SECRET || 'default-secret',
   apiVersion: process.env.API_VERSION || 'v1',
   jwtPublicKeyPath: path.resolve(process.cwd(), process.env.JWT_PUBLIC_KEY_PATH || './keys/public.pem'),
   jwtPrivateKeyPath: path.resolve(process.cwd(), process.env.JWT_PRIVATE_KEY_PATH || './keys/private.pem'),
   jwtRefreshExpiration: process.env.JWT_REFRESH_EXPIRATION || '7d',
   jwtAccessExpiration: process.env.JWT_ACCESS_EXPIRATION || '1h',
+  mongoMaxPoolSize: parseNumber(process.env.MONGO_MAX_POOL_SIZE, 50),
+  mongoMinPoolSize: parseNumber(process.env.MONGO_MIN_POOL_SIZE, 5),
+  mongoMaxIdleTimeMS: parseNumber(process.env.MONGO_MAX_IDLE_TIME_MS, 60000),
+  mongoWaitQueueTimeoutMS: parseNumber(process.env.MONGO_WAIT_QUEUE_TIMEOUT_MS, 5000),
+  mongoCompressors: parseList(process.env.MONGO_COMPRESSORS, ['zlib']),
 });
 
 const validateConfig = (config: IConfig): void => {
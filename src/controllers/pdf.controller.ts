@@ -15,51 +15,36 @@ export class PDFController {
   ) {}
 
   generatePDF: RequestHandler = async (req, res) => {
-    try {
-      const { templateName, data, options } = req.body;
+    const { templateName, data, options } = req.body;
 
-      // Validation check before processing
-      if (!templateName || !data) {
-        this.logger.error('Missing required parameters');
-        throw new ApiError('Missing required parameters', StatusCodes.BAD_REQUEST, 'PDFController');
-      }
-
-      const pdfBuffer = await this.pdfService.generatePDF(templateName, data, options);
-      
-      res.setHeader('Content-Type', 'application/pdf');
-      res.setHeader('Content-Disposition', `attachment; filename=${templateName}.pdf`);
-      res.status(StatusCodes.OK).send(pdfBuffer);
-    } catch (error) {
-      if (error instanceof ApiError) {
-        throw error;
-      }
-      this.logger.error('PDF generation failed', error);
-      throw new ApiError('PDF generation failed', StatusCodes.INTERNAL_SERVER_ERROR, 'PDFController');
+    // Validation check before processing
+    if (!templateName || !data) {
+      this.logger.error('Missing required parameters');
+      throw new ApiError('Missing required parameters', StatusCodes.BAD_REQUEST, 'PDFController');
     }
+
+    // PDFService already maps its failures to ApiError; anything else is handled by errorMiddleware
+    const pdfBuffer = await this.pdfService.generatePDF(templateName, data, options);
+
+    res.setHeader('Content-Type', 'application/pdf');
+    res.setHeader('Content-Disposition', `attachment; filename=${templateName}.pdf`);
+    res.status(StatusCodes.OK).send(pdfBuffer);
   };
 
   mergePDFs: RequestHandler = async (req, res) => {
-    try {
-      const files = (req as any).files as Express.Multer.File[];
-      
-      // Validation check before processing
-      if (!files || files.length < 2) {
-        this.logger.error('At least two PDF files are required');
-        throw new ApiError('At least two PDF files are required', StatusCodes.BAD_REQUEST, 'PDFController');
-      }
+    const files = (req as any).files as Express.Multer.File[];
 
-      const pdfBuffers = files.map(file => file.buffer);
-      const mergedPDF = await this.pdfService.mergePDFs(pdfBuffers);
-
-      res.setHeader('Content-Type', 'application/pdf');
-      res.setHeader('Content-Disposition', 'attachment; filename=merged.pdf');
-      res.status(StatusCodes.OK).send(mergedPDF);
-    } catch (error) {
-      if (error instanceof ApiError) {
-        throw error;
-      }
-      this.logger.error('PDF merging failed', error);
-      throw new ApiError('PDF merging failed', StatusCodes.INTERNAL_SERVER_ERROR, 'PDFController');
+    // Validation check before processing
+    if (!files || files.length < 2) {
+      this.logger.error('At least two PDF files are required');
+      throw new ApiError('At least two PDF files are required', StatusCodes.BAD_REQUEST, 'PDFController');
     }
+
+    const pdfBuffers = files.map(file => file.buffer);
+    const mergedPDF = await this.pdfService.mergePDFs(pdfBuffers);
+
+    res.setHeader('Content-Type', 'application/pdf');
+    res.setHeader('Content-Disposition', 'attachment; filename=merged.pdf');
+    res.status(StatusCodes.OK).send(mergedPDF);
   };
 }
\ No newline at end of file
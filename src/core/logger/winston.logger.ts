@@ -1,8 +1,24 @@
 import winston, { Logger, format, transports } from 'winston';
-import { ElasticsearchTransport } from 'winston-elasticsearch';
 import { ILogger } from '../../types';
 import { config } from '../../config';
 
+// Every service builds its own WinstonLogger; they all ship through one Elasticsearch client
+let elasticClient: import('@elastic/elasticsearch').Client | null = null;
+
+const getElasticClient = () => {
+  if (!elasticClient) {
+    const { Client } = require('@elastic/elasticsearch') as typeof import('@elastic/elasticsearch');
+    elasticClient = new Client({
+      node: config.elasticUrl,
+      maxRetries: 2,
+      requestTimeout: 10000,
+      sniffOnStart: false
+    });
+  }
+
+  return elasticClient;
+};
+
 export class WinstonLogger implements ILogger {
   private logger: Logger;
 
@@ -26,8 +42,14 @@ export class WinstonLogger implements ILogger {
     ];
 
     if (config.isElasticConfigured) {
+      // Only pull in the Elasticsearch client when it is actually configured
+      const { ElasticsearchTransport } = require('winston-elasticsearch') as typeof import('winston-elasticsearch');
       const elasticTransport = new ElasticsearchTransport({
         level: 'info',
+        // Queue records and ship them with the bulk API off the request path
+        buffering: true,
+        bufferLimit: 1000,
+        flushInterval: 2000,
         transformer: (logData) => ({
           '@timestamp': new Date().getTime(),
           severity: logData.level,
@@ -35,12 +57,7 @@ export class WinstonLogger implements ILogger {
           service: serviceName,
           fields: logData.meta
         }),
-        clientOpts: {
-          node: config.elasticUrl,
-          maxRetries: 2,
-          requestTimeout: 10000,
-          sniffOnStart: false
-        },
+        client: getElasticClient(),
         indexPrefix: `logs-${serviceName.toLowerCase()}-${config.nodeEnv}`
       });
 
@@ -69,4 +86,8 @@ export class WinstonLogger implements ILogger {
   debug(message: string, meta?: any): void {
     this.logger.debug(message, meta);
   }
+
+  isLevelEnabled(level: string): boolean {
+    return this.logger.isLevelEnabled(level);
+  }
 }
\ No newline at end of file
@@ -1,5 +1,50 @@
 import { ValidationValue, ValidatorFn, ValidatorParams, ValidatorResult } from './validation.types';
 
+// Non-ASCII code points matched by \s in JavaScript regular expressions
+const UNICODE_WHITESPACE = new Set([
+  0xa0, 0x1680, 0x2000, 0x2001, 0x2002, 0x2003, 0x2004, 0x2005, 0x2006, 0x2007, 0x2008, 0x2009, 0x200a,
+  0x2028, 0x2029, 0x202f, 0x205f, 0x3000, 0xfeff
+]);
+
+const CHAR_OTHER = 0;
+const CHAR_SPACE = 1;
+const CHAR_AT = 2;
+const CHAR_DOT = 3;
+
+// Class of every ASCII character, so the scan below is one table read per character
+const ASCII_CLASS = new Uint8Array(0x80);
+for (const code of [0x09, 0x0a, 0x0b, 0x0c, 0x0d, 0x20]) {
+  ASCII_CLASS[code] = CHAR_SPACE;
+}
+ASCII_CLASS[0x40] = CHAR_AT;
+ASCII_CLASS[0x2e] = CHAR_DOT;
+
+// Accepts exactly what /^[^\s@]+@[^\s@]+\.[^\s@]+$/ does, in a single pass; that pattern backtracks
+// quadratically on long domains without a dot
+const isEmail = (value: string): boolean => {
+  let at = -1;
+  // First dot with at least one domain character before it
+  let dot = -1;
+
+  for (let i = 0; i < value.length; i++) {
+    const code = value.charCodeAt(i);
+    const kind = code < 0x80 ? ASCII_CLASS[code] : UNICODE_WHITESPACE.has(code) ? CHAR_SPACE : CHAR_OTHER;
+    if (kind === CHAR_SPACE) { return false; }
+    if (kind === CHAR_AT) {
+      if (at !== -1 || i === 0) { return false; }
+      at = i;
+    } else if (kind === CHAR_DOT && dot === -1 && at !== -1 && i >= at + 2) {
+      dot = i;
+    }
+  }
+
+  // Domain needs a dot with at least one character on each side
+  return dot !== -1 && dot < value.length - 1;
+};
+
+// Built once at load instead of allocating a new RegExp object on every call
+const PASSWORD_PATTERN = /^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[!@#$%^&*()_+\-=\[\]{};':"\\|,.<>\/?])[A-Za-z\d!@#$%^&*()_+\-=\[\]{};':"\\|,.<>\/?]{8,}$/;
+
 export const StandardValidators: Record<string, ValidatorFn> = {
   required: (value: ValidationValue): ValidatorResult => {
     return value !== undefined && value !== null && value !== '';
@@ -12,7 +57,7 @@ export const StandardValidators: Record<string, ValidatorFn> = {
   email: (value: ValidationValue): ValidatorResult => {
     if (typeof value !== 'string') { return false; }
 
-    return /^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(value);
+    return isEmail(value);
   },
 
   min: (value: ValidationValue, params?: ValidatorParams): ValidatorResult => {
@@ -50,6 +95,6 @@ export const StandardValidators: Record<string, ValidatorFn> = {
   },
 
   password: (value: ValidationValue): ValidatorResult => {
-    return typeof value === 'string' && value.length >= 8 && /^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[!@#$%^&*()_+\-=\[\]{};':"\\|,.<>\/?])[A-Za-z\d!@#$%^&*()_+\-=\[\]{};':"\\|,.<>\/?]{8,}$/.test(value);
+    return typeof value === 'string' && value.length >= 8 && PASSWORD_PATTERN.test(value);
   }
 };
\ No newline at end of file
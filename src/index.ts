@@ -1,6 +1,7 @@
 import { App } from './app';
 import { WinstonLogger } from './core/logger/winston.logger';
 import { container } from './core/di/container';
+import { TYPES } from './core/di/types';
 
 
 const logger = new WinstonLogger('Main');
@@ -17,7 +18,7 @@ process.on('unhandledRejection', (reason: any) => {
 
 const startServer = async () => {
   try {
-    const app = container.resolve<App>(App);
+    const app = container.get<App>(TYPES.App);
     await app.start();
   } catch (error) {
     logger.error('Failed to start application', { error });
@@ -0,0 +1,7 @@
+import { Request, Response, NextFunction } from 'express';
+import { runWithRequestContext } from '../utils/requestContext';
+
+// Mounted on routers, so it runs after the app-level body parsers; their stream callbacks would otherwise drop the async context
+export const requestContext = (_req: Request, _res: Response, next: NextFunction): void => {
+  runWithRequestContext(() => next());
+};
@@ -7,6 +7,8 @@ const logger = new WinstonLogger('HTTP');
 morgan.token('req-id', (req: Request) => req.id);
 
 export const requestLogger = morgan(':req-id :method :url :status :response-time ms', {
+ // Skip formatting the line at all when info records would be dropped
+ skip: () => !logger.isLevelEnabled('info'),
  stream: {
    write: (message) => logger.info(message.trim())
  }
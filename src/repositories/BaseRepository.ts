@@ -1,5 +1,6 @@
-import { Collection, ObjectId, Filter, Sort, WithId, OptionalUnlessRequiredId } from 'mongodb';
-import { IBaseRepository, QueryOptions } from './IBaseRepository';
+import { Collection, ObjectId, Filter, Sort, WithId, OptionalUnlessRequiredId, Document, AnyBulkWriteOperation, BulkWriteResult, ReadPreferenceLike, WriteConcernSettings, UpdateFilter, FindCursor, BSON } from 'mongodb';
+import { IBaseRepository, QueryOptions, RepositoryOptions } from './IBaseRepository';
+import { getRequestContext } from '../utils/requestContext';
 
 
 export interface BaseDocument {
@@ -9,78 +10,207 @@ export interface BaseDocument {
   updatedAt: Date;
 }
 
+// Server-side cap on documents per insert batch
+export const INSERT_BATCH_SIZE = 1000;
+// Upper bound on documents a single page can pull into memory
+export const MAX_PAGE_SIZE = 1000;
+// Documents per getMore when streaming; the driver's default first batch is only 101
+export const STREAM_BATCH_SIZE = 1000;
+
 export class BaseRepository<T extends BaseDocument> implements IBaseRepository<T> {
-  constructor(protected collection: Collection<T>) { }
+  // Reads can be routed away from the primary; writes always use the collection's own settings
+  protected readonly readOptions: { readPreference?: ReadPreferenceLike };
+  // Only the batch paths take a custom write concern; single-document writes report on their result
+  protected readonly bulkWriteOptions: { writeConcern?: WriteConcernSettings };
+  // readOptions plus the default projection, for the find paths only
+  protected readonly findOptions: { readPreference?: ReadPreferenceLike; projection?: Document };
+
+  constructor(protected collection: Collection<T>, options: RepositoryOptions = {}) {
+    this.readOptions = options.readPreference ? { readPreference: options.readPreference } : {};
+    this.bulkWriteOptions = options.writeConcern ? { writeConcern: options.writeConcern } : {};
+    this.findOptions = options.defaultProjection
+      ? { ...this.readOptions, projection: options.defaultProjection }
+      : this.readOptions;
+  }
 
   protected getBaseQuery(): Filter<T> {
     return { isDeleted: false } as Filter<T>;
   }
 
+  // Reuse an ObjectId the caller already holds rather than re-parsing its hex string
+  protected toObjectId(id: string | ObjectId): ObjectId {
+    return id instanceof ObjectId ? id : new ObjectId(id);
+  }
+
   async findOne(query: Filter<T>): Promise<WithId<T> | null> {
-    return this.collection.findOne({ ...this.getBaseQuery(), ...query });
+    const filter = { ...this.getBaseQuery(), ...query };
+    const cache = this.getRequestCache();
+    if (!cache) {
+      return this.collection.findOne(filter, this.findOptions);
+    }
+
+    // The same lookup often runs several times per request (auth, session, handler); hit the server once
+    const key = BSON.EJSON.stringify(filter);
+    let pending = cache.get(key) as Promise<WithId<T> | null> | undefined;
+    if (!pending) {
+      pending = this.collection.findOne(filter, this.findOptions);
+      cache.set(key, pending);
+      pending.catch(() => cache.delete(key));
+    }
+    // Each caller gets its own top-level copy; nested values are still shared and must be treated as read-only
+    const doc = await pending;
+    return doc && { ...doc };
+  }
+
+  private getRequestCache(): Map<string, Promise<unknown>> | undefined {
+    const context = getRequestContext();
+    if (!context) {
+      return undefined;
+    }
+    let cache = context.queryCache.get(this.collection.namespace);
+    if (!cache) {
+      cache = new Map();
+      context.queryCache.set(this.collection.namespace, cache);
+    }
+    return cache;
+  }
+
+  // Any write can change what a memoized read would return, so drop this collection's entries
+  protected invalidateRequestCache(): void {
+    getRequestContext()?.queryCache.delete(this.collection.namespace);
   }
 
   async findMany(query: Filter<T>, options?: QueryOptions): Promise<WithId<T>[]> {
-    let cursor = this.collection.find(query);
+    return this.buildCursor(query, options).toArray();
+  }
+
+  // Yields documents batch by batch so large result sets never sit in memory all at once
+  iterate(query: Filter<T>, options?: QueryOptions): AsyncIterable<WithId<T>> {
+    return this.buildCursor(query, { batchSize: STREAM_BATCH_SIZE, ...options });
+  }
+
+  protected buildCursor(query: Filter<T>, options?: QueryOptions): FindCursor<WithId<T>> {
+    let cursor = this.collection.find(query, this.findOptions);
     if (options?.sort) cursor = cursor.sort(options.sort as Sort);
     if (options?.limit) cursor = cursor.limit(options.limit);
     if (options?.skip) cursor = cursor.skip(options.skip);
+    if (options?.batchSize) cursor = cursor.batchSize(options.batchSize);
     if (options?.select) {
-      const projection = options.select.reduce((acc, field) => ({ ...acc, [field]: 1 }), {});
-      cursor = cursor.project(projection);
+      cursor = cursor.project(this.buildProjection(options.select));
     }
-    return cursor.toArray();
+    return cursor;
+  }
+
+  // Built in one pass; spreading the accumulator per field made this quadratic in the field count
+  protected buildProjection(fields: string[]): Document {
+    const projection: Document = {};
+    for (const field of fields) {
+      projection[field] = 1;
+    }
+    return projection;
   }
 
   async create(data: Partial<T>): Promise<WithId<T>> {
-    const result = await this.collection.insertOne({
+    const now = new Date();
+    const document = {
+      isDeleted: false,
       ...data,
-      createdAt: new Date(),
-      updatedAt: new Date(),
-    } as unknown as OptionalUnlessRequiredId<T>);
+      createdAt: now,
+      updatedAt: now,
+    } as unknown as OptionalUnlessRequiredId<T>;
+    const result = await this.collection.insertOne(document);
+    this.invalidateRequestCache();
+
+    // The stored document is exactly what was sent, so skip the read-back round trip
+    return { ...document, _id: result.insertedId } as WithId<T>;
+  }
 
-    return this.collection.findOne({ _id: result.insertedId as ObjectId } as Filter<T>) as Promise<WithId<T>>
+  async createMany(items: Partial<T>[]): Promise<number> {
+    const now = new Date();
+    let inserted = 0;
+    for (let i = 0; i < items.length; i += INSERT_BATCH_SIZE) {
+      const batch = items.slice(i, i + INSERT_BATCH_SIZE).map(data => ({
+        isDeleted: false,
+        ...data,
+        createdAt: now,
+        updatedAt: now,
+      }) as unknown as OptionalUnlessRequiredId<T>);
+      const result = await this.collection.insertMany(batch, { ordered: false, ...this.bulkWriteOptions });
+      inserted += result.insertedCount;
+    }
+    this.invalidateRequestCache();
+    return inserted;
+  }
+
+  // Mixed inserts/updates/deletes go out as one unordered bulk command; the driver splits oversized batches
+  async bulkWrite(operations: AnyBulkWriteOperation<T>[]): Promise<BulkWriteResult | null> {
+    if (operations.length === 0) {
+      return null;
+    }
+    const now = new Date();
+    const stamped = operations.map(operation => this.stampOperation(operation, now));
+    const result = await this.collection.bulkWrite(stamped, { ordered: false, ...this.bulkWriteOptions });
+    this.invalidateRequestCache();
+    return result;
   }
 
-  async update(id: string, data: Partial<T>): Promise<WithId<T> | null> {
-    const objectId = new ObjectId(id);
+  // Returns a copy with $set.updatedAt added so callers can safely reuse (or retry with) their update
+  protected stampUpdate(update: UpdateFilter<T>, now: Date): UpdateFilter<T> {
+    return { ...update, $set: { ...update.$set, updatedAt: now } } as UpdateFilter<T>;
+  }
+
+  private stampOperation(operation: AnyBulkWriteOperation<T>, now: Date): AnyBulkWriteOperation<T> {
+    if ('insertOne' in operation) {
+      const document = { ...operation.insertOne.document, createdAt: now, updatedAt: now };
+      return { insertOne: { document } } as AnyBulkWriteOperation<T>;
+    }
+    if ('updateOne' in operation && !Array.isArray(operation.updateOne.update)) {
+      const update = this.stampUpdate(operation.updateOne.update as UpdateFilter<T>, now);
+      return { updateOne: { ...operation.updateOne, update } };
+    }
+    if ('updateMany' in operation && !Array.isArray(operation.updateMany.update)) {
+      const update = this.stampUpdate(operation.updateMany.update as UpdateFilter<T>, now);
+      return { updateMany: { ...operation.updateMany, update } };
+    }
+    return operation;
+  }
+
+  async update(id: string | ObjectId, data: Partial<T>): Promise<WithId<T> | null> {
+    const objectId = this.toObjectId(id);
     const updated = await this.collection.findOneAndUpdate(
       { _id: objectId } as Filter<T>,
-      {
-        $set: {
-          ...data,
-          updatedAt: new Date()
-        } as Partial<T>
-      },
+      this.stampUpdate({ $set: data } as UpdateFilter<T>, new Date()),
       { returnDocument: 'after' }
     );
+    this.invalidateRequestCache();
     return updated;
   }
 
-  async delete(id: string): Promise<boolean> {
-    const objectId = new ObjectId(id);
+  async delete(id: string | ObjectId): Promise<boolean> {
+    const objectId = this.toObjectId(id);
     const result = await this.collection.updateOne(
       { _id: objectId } as Filter<T>,
-      {
-        $set: {
-          isDeleted: true,
-          updatedAt: new Date()
-        } as unknown as Partial<T>
-      }
+      this.stampUpdate({ $set: { isDeleted: true } } as UpdateFilter<T>, new Date())
     );
+    this.invalidateRequestCache();
     return result.modifiedCount === 1;
   }
 
   async count(query: Filter<T>): Promise<number> {
-    return this.collection.countDocuments(query);
+    // An unfiltered count can come from collection metadata instead of an index scan
+    if (Object.keys(query).length === 0) {
+      return this.collection.estimatedDocumentCount(this.readOptions);
+    }
+    return this.collection.countDocuments(query, this.readOptions);
   }
 
   async paginate(query: Filter<T>, page: number, limit: number): Promise<{
     items: WithId<T>[];
     total: number;
   }> {
+    const pageSize = Math.min(Math.max(1, limit), MAX_PAGE_SIZE);
     const [items, total] = await Promise.all([
-      this.findMany(query, { skip: (page - 1) * limit, limit }),
+      this.findMany(query, { skip: (Math.max(1, page) - 1) * pageSize, limit: pageSize, batchSize: pageSize }),
       this.count(query)
     ]);
     return { items, total };
@@ -1,11 +1,14 @@
-import { Filter, Sort, WithId } from 'mongodb';
+import { AnyBulkWriteOperation, BulkWriteResult, Document, Filter, ObjectId, ReadPreferenceLike, Sort, WithId, WriteConcernSettings } from 'mongodb';
 
 export interface IBaseRepository<T> {
   findOne(query: Filter<T>): Promise<WithId<T> | null>;
   findMany(query: Filter<T>, options?: QueryOptions): Promise<WithId<T>[]>;
+  iterate(query: Filter<T>, options?: QueryOptions): AsyncIterable<WithId<T>>;
   create(data: Partial<T>): Promise<WithId<T>>;
-  update(id: string, data: Partial<T>): Promise<WithId<T> | null>;
-  delete(id: string): Promise<boolean>;
+  createMany(items: Partial<T>[]): Promise<number>;
+  bulkWrite(operations: AnyBulkWriteOperation<T>[]): Promise<BulkWriteResult | null>;
+  update(id: string | ObjectId, data: Partial<T>): Promise<WithId<T> | null>;
+  delete(id: string | ObjectId): Promise<boolean>;
   count(query: Filter<T>): Promise<number>;
 }
 
@@ -14,4 +17,13 @@ export interface QueryOptions {
   limit?: number;
   skip?: number;
   select?: string[];
-}
\ No newline at end of file
+  batchSize?: number;
+}
+
+export interface RepositoryOptions {
+  readPreference?: ReadPreferenceLike;
+  // e.g. { w: 0 } for fire-and-forget collections; createMany/bulkWrite counts are then not reported
+  writeConcern?: WriteConcernSettings;
+  // Applied to findOne/findMany when the caller does not `select` fields, e.g. { password: 0 } to strip heavy or sensitive fields
+  defaultProjection?: Document;
+}
@@ -1,16 +1,25 @@
 import { injectable } from 'inversify';
-import { BaseRepository } from '@gateway/repositories/BaseRepository';
+import { BaseRepository, INSERT_BATCH_SIZE } from '@gateway/repositories/BaseRepository';
 import { IUser, ISSOUser, ICredentialsUser } from './IUser';
 import { getMongoConnection } from '@gateway/utils/mongoConnection';
-import { Condition, ObjectId, Filter } from 'mongodb';
+import { Condition, ObjectId, Filter, MongoServerError, MongoBulkWriteError, WithId } from 'mongodb';
 import { ApiError } from '@gateway/core/errors/api.error';
 import { StatusCodes } from 'http-status-codes';
 import { Request } from 'express';
 import { CollectionName } from '@gateway/constants/db';
+import { ensureIndex } from '@gateway/utils/ensureIndex';
 
+const DUPLICATE_KEY_ERROR = 11000;
+// Rejects malformed ids up front instead of letting the ObjectId constructor throw on them
+const OBJECT_ID_PATTERN = /^[0-9a-fA-F]{24}$/;
 
 @injectable()
 export class UserRepository extends BaseRepository<IUser> {
+    // Nothing but the unique email index stops duplicate accounts, so create() waits for it
+    private activeUserIndexes: Promise<void>;
+    // Settles once legacy users carry isDeleted, which findByEmail's filter and the partial indexes rely on
+    private isDeletedBackfill: Promise<void>;
+
     constructor() {
         try {
             getMongoConnection().getClient();
@@ -18,42 +27,187 @@ export class UserRepository extends BaseRepository<IUser> {
             getMongoConnection().connect();
         }
         const collection = getMongoConnection().getClient().db().collection<IUser>(CollectionName.USERS);
-        super(collection);
-        this.createIndexes();
+        // Credentials are only needed by findByEmail, which reads the collection directly
+        super(collection, { defaultProjection: { password: 0, accessToken: 0 } });
+        this.isDeletedBackfill = this.backfillIsDeleted();
+        this.activeUserIndexes = this.createActiveUserIndexes();
+        this.createIndexes().catch(error => {
+            console.error('Failed to create user indexes:', error);
+        });
     }
 
 
     private async createIndexes(): Promise<void> {
-        await this.collection.createIndex(
-            { lastActiveAt: 1 },
-            { expireAfterSeconds: 60 * 60 * 24 * 30, background: true }
+        await Promise.all([
+            ensureIndex(
+                this.collection,
+                { lastActiveAt: 1 },
+                { expireAfterSeconds: 60 * 60 * 24 * 30, background: true }
+            ),
+            this.activeUserIndexes
+        ]);
+    }
+
+    // Fails loudly while the email index is missing instead of accepting unchecked inserts; a failed
+    // build is retried by the next caller
+    private async ensureActiveUserIndexes(): Promise<void> {
+        try {
+            await this.activeUserIndexes;
+        } catch {
+            // Either step may be what failed; rerunning the backfill is a no-op if it already landed
+            this.isDeletedBackfill = this.backfillIsDeleted();
+            this.activeUserIndexes = this.createActiveUserIndexes();
+            await this.activeUserIndexes.catch(error => {
+                console.error('Failed to create user indexes:', error);
+                throw new ApiError('User registration is unavailable', StatusCodes.SERVICE_UNAVAILABLE, 'UserRepository');
+            });
+        }
+    }
+
+    // Partial indexes only see documents with isDeleted: false, so legacy users are backfilled first
+    private async createActiveUserIndexes(): Promise<void> {
+        await this.isDeletedBackfill;
+        await Promise.all([
+            // Uniqueness is enforced here rather than by a lookup before each insert; soft-deleted
+            // accounts are left out so their address can be registered again
+            ensureIndex(
+                this.collection,
+                { email: 1 },
+                { unique: true, partialFilterExpression: { isDeleted: false }, name: 'uniq_email_active' }
+            ),
+            // findByProvider; the base query always carries isDeleted: false, so the partial index applies
+            ensureIndex(
+                this.collection,
+                { provider: 1, providerId: 1 },
+                { partialFilterExpression: { isDeleted: false }, name: 'provider_active' }
+            )
+        ]);
+    }
+
+    // Users written before create() stamped isDeleted have no such field; a no-op once all of them do
+    private async backfillIsDeleted(): Promise<void> {
+        await this.collection.updateMany(
+            { isDeleted: { $exists: false } } as Filter<IUser>,
+            { $set: { isDeleted: false } }
         );
     }
 
     private async runWithErrorHandling<T>(fn: () => Promise<T>, errorMessage: string): Promise<T> {
         try {
             return await fn();
-        } catch {
+        } catch (error) {
+            // Already mapped (e.g. "Failed to update user activity"); re-wrapping would hide the real cause
+            if (error instanceof ApiError) {
+                throw error;
+            }
+            if (error instanceof MongoServerError && error.code === DUPLICATE_KEY_ERROR) {
+                throw new ApiError('User already exists', StatusCodes.CONFLICT, 'UserRepository');
+            }
             throw new ApiError(errorMessage, StatusCodes.INTERNAL_SERVER_ERROR, 'UserRepository');
         }
     }
 
 
 
+    async create(data: Partial<IUser>): Promise<WithId<IUser>> {
+        return this.runWithErrorHandling(async () => {
+            await this.ensureActiveUserIndexes();
+            return await super.create({ ...data, email: data.email?.toLowerCase() });
+        }, 'Failed to create user');
+    }
+
+
+    // Bulk import: one unordered insertMany per batch, with the unique email index reporting conflicts instead
+    // of a lookup per user; emails repeated within the input are skipped before anything is sent
+    async createUsers(users: Partial<IUser>[]): Promise<{ insertedCount: number; duplicateEmails: string[] }> {
+        const seen = new Set<string>();
+        const duplicateEmails: string[] = [];
+        const unique: Partial<IUser>[] = [];
+        for (const user of users) {
+            const email = user.email?.toLowerCase();
+            if (email && seen.has(email)) {
+                duplicateEmails.push(email);
+                continue;
+            }
+            if (email) {
+                seen.add(email);
+            }
+            unique.push(email ? { ...user, email } : user);
+        }
+
+        return this.runWithErrorHandling(async () => {
+            await this.ensureActiveUserIndexes();
+            let insertedCount = 0;
+            for (let i = 0; i < unique.length; i += INSERT_BATCH_SIZE) {
+                // Never larger than createMany's own batch, so error indexes line up with this slice
+                const batch = unique.slice(i, i + INSERT_BATCH_SIZE);
+                try {
+                    insertedCount += await this.createMany(batch);
+                } catch (error) {
+                    if (!(error instanceof MongoBulkWriteError)) {
+                        throw error;
+                    }
+                    const writeErrors = Array.isArray(error.writeErrors) ? error.writeErrors : [error.writeErrors];
+                    if (writeErrors.some(writeError => writeError.code !== DUPLICATE_KEY_ERROR)) {
+                        throw error;
+                    }
+                    this.invalidateRequestCache();
+                    insertedCount += error.insertedCount;
+                    for (const writeError of writeErrors) {
+                        duplicateEmails.push(batch[writeError.index].email!);
+                    }
+                }
+            }
+            return { insertedCount, duplicateEmails };
+        }, 'Failed to create users');
+    }
+
+
     async findByEmail(email: string): Promise<ICredentialsUser | null> {
-        const user = await this.collection.findOne({ email: email.toLowerCase() }) as ICredentialsUser | null;
+        // Until the backfill lands, legacy users would not match the isDeleted predicate and could not log in.
+        // A failed backfill is logged by createIndexes and must not block logins for everyone else
+        await this.isDeletedBackfill.catch(() => undefined);
+        // The isDeleted predicate is what lets the partial unique index serve this query
+        const user = await this.collection.findOne(
+            { email: email.toLowerCase(), isDeleted: false }
+        ) as ICredentialsUser | null;
         return user;
     }
 
 
-    async findById(id: string): Promise<IUser | null> {
+    async findById(id: string | ObjectId): Promise<IUser | null> {
         return this.runWithErrorHandling(async () => {
-            const user = await this.findOne({ _id: new ObjectId(id) });
+            const user = await this.findOne({ _id: this.parseUserId(id) });
             return user || null;
         }, 'Cannot connect to database');
     }
 
 
+    // One $in query instead of a findById round trip per id; results follow the order of `ids`, missing users are skipped
+    async findByIds(ids: Array<string | ObjectId>): Promise<IUser[]> {
+        if (ids.length === 0) {
+            return [];
+        }
+        return this.runWithErrorHandling(async () => {
+            const objectIds = ids.map(id => this.parseUserId(id));
+            const users = await this.findMany(
+                { ...this.getBaseQuery(), _id: { $in: objectIds } } as Filter<IUser>,
+                { batchSize: objectIds.length }
+            );
+
+            const byId = new Map(users.map(user => [String(user._id), user]));
+            const ordered: IUser[] = [];
+            for (const objectId of objectIds) {
+                const user = byId.get(objectId.toHexString());
+                if (user) {
+                    ordered.push(user);
+                }
+            }
+            return ordered;
+        }, 'Cannot connect to database');
+    }
+
+
     async findByProvider(provider: ISSOUser['provider'], providerId: string): Promise<IUser | null> {
         return this.runWithErrorHandling(async () => {
             return await this.findOne({ provider, providerId });
@@ -61,23 +215,24 @@ export class UserRepository extends BaseRepository<IUser> {
     }
 
 
-    async incrementFailedAttempts(userId: string): Promise<void> {
+    async incrementFailedAttempts(userId: string | ObjectId): Promise<void> {
         return this.runWithErrorHandling(async () => {
             await this.collection.updateOne(
-                { _id: new ObjectId(userId) } as Condition<IUser>,
+                { _id: this.toObjectId(userId) } as Condition<IUser>,
                 {
                     $inc: { failedLoginAttempts: 1 },
                     $currentDate: { updatedAt: true }
                 }
             );
+            this.invalidateRequestCache();
         }, 'Cannot connect to database');
     }
 
 
-    async resetFailedAttempts(userId: string): Promise<void> {
+    async resetFailedAttempts(userId: string | ObjectId): Promise<void> {
         return this.runWithErrorHandling(async () => {
             await this.collection.updateOne(
-                { _id: new ObjectId(userId) } as Condition<IUser>,
+                { _id: this.toObjectId(userId) } as Condition<IUser>,
                 {
                     $set: {
 
@@ -87,58 +242,46 @@ export class UserRepository extends BaseRepository<IUser> {
                     $currentDate: { updatedAt: true }
                 }
             );
+            this.invalidateRequestCache();
         }, 'Cannot connect to database');
     }
 
 
-    async updateLastLogin(userId: string, deviceInfo?: Request['deviceInfo']): Promise<void> {
-        return this.runWithErrorHandling(async () => {
-            const updateData: any = {
-                lastLogin: new Date(),
-                lastActiveAt: new Date(),
-                updatedAt: new Date()
-            };
-            if (deviceInfo) {
-                updateData.deviceInfo = deviceInfo;
-            }
-            const result = await this.collection.updateOne(
-                { _id: new ObjectId(userId) } as Condition<IUser>,
-                {
+    async updateLastLogin(userId: string | ObjectId, deviceInfo?: Request['deviceInfo']): Promise<void> {
+        const now = new Date();
+        return this.runWithErrorHandling(
+            () => this.touch(userId, { lastLogin: now, lastActiveAt: now, updatedAt: now }, deviceInfo),
+            'Cannot connect to database'
+        );
+    }
 
-                    $set: updateData
-                }
-            );
-            if (result.modifiedCount === 0) {
-                throw new ApiError('Failed to update user activity', StatusCodes.INTERNAL_SERVER_ERROR, 'UserRepository');
-            }
-        }, 'Cannot connect to database');
+
+    async updateActivity(userId: string | ObjectId, deviceInfo?: Request['deviceInfo']): Promise<void> {
+        const now = new Date();
+        return this.runWithErrorHandling(
+            () => this.touch(userId, { lastActiveAt: now, updatedAt: now }, deviceInfo),
+            'Failed to update user activity'
+        );
     }
 
 
-    async updateActivity(userId: string, deviceInfo?: Request['deviceInfo']): Promise<void> {
-        return this.runWithErrorHandling(async () => {
-            const updateData: any = {
-                lastActiveAt: new Date(),
-                updatedAt: new Date()
-            };
-            if (deviceInfo) {
-                updateData.deviceInfo = deviceInfo;
-            }
-            const result = await this.collection.updateOne(
-                { _id: new ObjectId(userId) } as Condition<IUser>,
-                { $set: updateData }
-            );
-            if (result.modifiedCount === 0) {
-                throw new ApiError('Failed to update user activity', StatusCodes.INTERNAL_SERVER_ERROR, 'UserRepository');
-            }
-        }, 'Failed to update user activity');
+    // Shared by updateLastLogin and updateActivity, which differ only in the timestamps they set
+    private async touch(userId: string | ObjectId, updateData: Partial<IUser>, deviceInfo?: Request['deviceInfo']): Promise<void> {
+        const result = await this.collection.updateOne(
+            { _id: this.toObjectId(userId) } as Condition<IUser>,
+            { $set: deviceInfo ? { ...updateData, deviceInfo } : updateData }
+        );
+        this.invalidateRequestCache();
+        if (result.modifiedCount === 0) {
+            throw new ApiError('Failed to update user activity', StatusCodes.INTERNAL_SERVER_ERROR, 'UserRepository');
+        }
     }
 
 
-    async getInactivityTime(userId: string): Promise<number> {
+    async getInactivityTime(userId: string | ObjectId): Promise<number> {
         return this.runWithErrorHandling(async () => {
             const pipeline = [
-                { $match: { _id: new ObjectId(userId) } },
+                { $match: { _id: this.toObjectId(userId) } },
                 {
 
                     $project: {
@@ -160,6 +303,14 @@ export class UserRepository extends BaseRepository<IUser> {
     async deleteMany(filter: Filter<IUser> = {}): Promise<void> {
         return this.runWithErrorHandling(async () => {
             await this.collection.deleteMany(filter);
+            this.invalidateRequestCache();
         }, 'Cannot connect to database');
     }
+
+    private parseUserId(id: string | ObjectId): ObjectId {
+        if (typeof id === 'string' && !OBJECT_ID_PATTERN.test(id)) {
+            throw new ApiError('Invalid user ID format', StatusCodes.BAD_REQUEST, 'UserRepository');
+        }
+        return this.toObjectId(id);
+    }
 } 
\ No newline at end of file
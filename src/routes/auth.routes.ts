@@ -1,6 +1,7 @@
 import { Router } from 'express';
 import { AuthController } from '@gateway/controllers/auth.controller';
 import { createValidator } from '@gateway/middleware/validate-request.middleware';
+import { requestContext } from '@gateway/middleware/request-context.middleware';
 import { injectable, inject } from 'inversify';
 import { TYPES } from '../core/di/types';
 
@@ -17,6 +18,9 @@ export class AuthRoutes {
     }
 
     private setupRoutes(): void {
+        // Only these endpoints read users through the repositories, so only they pay for a request context
+        this.router.use(requestContext);
+
         const loginValidator = createValidator({
             body: ['email', 'password']
         });
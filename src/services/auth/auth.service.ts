@@ -10,6 +10,7 @@ import { StandardValidators } from '@gateway/core/validation/validators';
 import { LoginResponse } from '@gateway/services/auth/types';
 import { TYPES } from '@gateway/core/di/types';
 import { ICredentialsUser, IUser } from '@gateway/repositories/user/IUser';
+import { ObjectId } from 'mongodb';
 
 
 @injectable()
@@ -47,21 +48,25 @@ export class AuthService {
     async signup(reqBody: Partial<ICredentialsUser>): Promise<ICredentialsUser> {
 
         this.validateEmail(reqBody.email!);
-        const userExists = await this.userRepository.findByEmail(reqBody.email!);
-        if (userExists) {
-            throw new ApiError('User already exists', StatusCodes.BAD_REQUEST, 'AuthService');
-        }
         const hashedPassword = await this.passwordService.hashPassword(reqBody.password!);
-        const user = this.userRepository.create({
+        const now = Date.now();
+        // A taken email surfaces from the unique index instead of a lookup beforehand
+        const user = await this.userRepository.create({
             email: reqBody.email,
             password: hashedPassword,
             profile: reqBody.profile,
             role: 'user',
-            roleExp: reqBody.roleExp || new Date(Date.now() + 1000 * 60 * 60 * 24 * 30),
+            roleExp: reqBody.roleExp || new Date(now + 1000 * 60 * 60 * 24 * 30),
             permissions: reqBody.permissions || ['read'],
             isActive: true,
             isEmailVerified: false,
-            lastActiveAt: new Date()
+            lastActiveAt: new Date(now)
+        }).catch(error => {
+            // Keep the response this endpoint has always given for a taken email
+            if (error instanceof ApiError && error.statusCode === StatusCodes.CONFLICT) {
+                throw new ApiError('User already exists', StatusCodes.BAD_REQUEST, 'AuthService');
+            }
+            throw error;
         });
         if (!user) {
             throw new ApiError('Failed to create user', StatusCodes.INTERNAL_SERVER_ERROR, 'AuthService');
@@ -84,10 +89,11 @@ export class AuthService {
             throw new ApiError('Account is locked', StatusCodes.UNAUTHORIZED, 'AuthService');
         }
 
+        const userId = user._id!.toString();
         const isPasswordValid = await this.passwordService.comparePassword(password, user.password);
         if (!isPasswordValid) {
             await this.runWithErrorHandling(
-                () => this.handleFailedLogin(user._id!.toString()),
+                () => this.handleFailedLogin(user._id!),
                 'Failed to update login attempts'
             );
             throw new ApiError('Invalid credentials', StatusCodes.UNAUTHORIZED, 'AuthService');
@@ -95,33 +101,35 @@ export class AuthService {
 
         await this.runWithErrorHandling(
             async () => {
-                await this.handleSuccessfulLogin(user._id!.toString());
+                await this.handleSuccessfulLogin(user);
                 await this.sessionService.createSession(user as IUser, deviceInfo as Request['deviceInfo']);
             },
             'Failed to complete login process'
         );
 
         const accessToken = this.jwtService.generateToken({
-            sub: user._id!.toString(),
+            sub: userId,
             permissions: user.permissions
         });
 
         const refreshToken = await this.jwtService.generateRefreshToken({
-            sub: user._id!.toString(),
+            sub: userId,
             permissions: user.permissions
         });
 
-        this.userRepository.updateLastLogin(user._id!.toString())
-
-        return { accessToken, refreshToken, id: user._id!.toString() };
+        return { accessToken, refreshToken, id: userId };
     }
 
-    private async handleFailedLogin(userId: string): Promise<void> {
+    private async handleFailedLogin(userId: string | ObjectId): Promise<void> {
         await this.userRepository.incrementFailedAttempts(userId);
     }
 
-    private async handleSuccessfulLogin(userId: string): Promise<void> {
-        await this.userRepository.resetFailedAttempts(userId);
-        await this.userRepository.updateLastLogin(userId);
+    private async handleSuccessfulLogin(user: ICredentialsUser): Promise<void> {
+        // Pass the ObjectId the driver returned; the repository would otherwise re-parse a hex string per call
+        const userId = user._id!;
+        // Most logins have nothing to reset; skip the write rather than rewrite identical values
+        if (user.failedLoginAttempts || user.lockUntil) {
+            await this.userRepository.resetFailedAttempts(userId);
+        }
     }
 } 
\ No newline at end of file
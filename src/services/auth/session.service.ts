@@ -17,8 +17,8 @@ export class SessionService {
 
     async createSession(user: IUser, deviceInfo: Request['deviceInfo']): Promise<void> {
         try {
-            await this.userRepository.updateActivity(user._id!.toString(), deviceInfo)
-            await this.userRepository.updateLastLogin(user._id!.toString(), deviceInfo)
+            // The only write a login makes to the user: lastLogin, lastActiveAt and the device info together
+            await this.userRepository.updateLastLogin(user._id!, deviceInfo)
         } catch (error) {
             throw new ApiError('Failed to update user activity', StatusCodes.INTERNAL_SERVER_ERROR, 'SessionService');
         }
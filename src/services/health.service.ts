@@ -1,6 +1,9 @@
 import { WinstonLogger } from '../core/logger/winston.logger';
 import { injectable } from 'inversify';
 
+// Fixed for the life of the process, so resolve it once rather than per snapshot
+const APP_VERSION = process.env.npm_package_version || '1.0.0';
+
 export interface IHealthCheck {
   status: string;
   uptime: number;
@@ -17,22 +20,33 @@ export interface IHealthCheck {
  @injectable()
  export class HealthService {
   private logger = new WinstonLogger('HealthService');
+  // Probes hit this every few seconds; serve a recent snapshot instead of re-sampling each time
+  private readonly cacheTtlMs = 5000;
+  private cached: { value: IHealthCheck; expiresAt: number } | null = null;
  
   async checkHealth(): Promise<IHealthCheck> {
-    this.logger.info('Performing health check');
+    const now = Date.now();
+    if (this.cached && this.cached.expiresAt > now) {
+      return this.cached.value;
+    }
+
+    this.logger.debug('Performing health check');
     
     const memory = process.memoryUsage();
     
-    return {
+    const value: IHealthCheck = {
       status: 'healthy',
       uptime: process.uptime(),
-      timestamp: new Date().toISOString(),
-      version: process.env.npm_package_version || '1.0.0',
+      timestamp: new Date(now).toISOString(),
+      version: APP_VERSION,
       memory: {
         used: memory.heapUsed,
         total: memory.heapTotal,
         rss: memory.rss
       }
     };
+    this.cached = { value, expiresAt: now + this.cacheTtlMs };
+
+    return value;
   }
  }
\ No newline at end of file
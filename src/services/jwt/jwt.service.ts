@@ -8,7 +8,16 @@ import { IMongoConnection, getMongoConnection } from '@gateway/utils/mongoConnec
 import { randomUUID } from 'crypto';
 import { injectable, optional, unmanaged } from 'inversify';
 import { CollectionName } from '@gateway/constants/db';
+import { Collection, MongoClient } from 'mongodb';
+import { ensureIndex } from '@gateway/utils/ensureIndex';
 
+const EXPIRATION_PATTERN = /^(\d+)([dhms])$/;
+const EXPIRATION_UNIT_SECONDS: Record<string, number> = {
+    's': 1,
+    'm': 60,
+    'h': 60 * 60,
+    'd': 24 * 60 * 60
+};
 
 /**
  * Service for handling JWT tokens with refresh token support
@@ -19,9 +28,11 @@ export class JwtService {
     private privateKey!: string;
     private accessExpiration!: string | number;
     private refreshExpiration!: string | number;
+    private refreshExpirationMs!: number;
     private readonly db: IMongoConnection;
     private readonly verifyOptions = { algorithms: ['RS256'] };
     private readonly MAX_CONCURRENT_SESSIONS = 5;
+    private jtiCache: { client: MongoClient; collection: Collection<JtiDocument> } | null = null;
 
     constructor(@optional() @unmanaged() db?: IMongoConnection) {
         this.db = db || getMongoConnection();
@@ -36,6 +47,8 @@ export class JwtService {
             this.privateKey = fs.readFileSync(config.jwtPrivateKeyPath!, 'utf8');
             this.accessExpiration = config.jwtAccessExpiration;
             this.refreshExpiration = config.jwtRefreshExpiration;
+            // Fixed for the life of the service, so parse it once instead of per issued token
+            this.refreshExpirationMs = this.parseExpiration(this.refreshExpiration);
 
             this.initialize().catch(error => {
                 console.error('Failed to initialize TTL index:', error);
@@ -56,17 +69,33 @@ export class JwtService {
         }
     }
 
-    private jtiCollection() {
-        return this.db.getClient().db().collection<JtiDocument>(CollectionName.JTI);
+    private jtiCollection(): Collection<JtiDocument> {
+        const client = this.db.getClient();
+        if (this.jtiCache && this.jtiCache.client === client) {
+            return this.jtiCache.collection;
+        }
+        const collection = client.db().collection<JtiDocument>(CollectionName.JTI);
+        this.jtiCache = { client, collection };
+
+        return collection;
     }
 
     private async initializeJtiTTLIndex() {
         try {
             const collection = this.jtiCollection();
-            await collection.createIndex(
-                { expiresAt: 1 },
-                { expireAfterSeconds: 0, background: true }
-            );
+            await Promise.all([
+                ensureIndex(
+                    collection,
+                    { expiresAt: 1 },
+                    { expireAfterSeconds: 0, background: true }
+                ),
+                // Serves the active-session count in validateConcurrentSessions without scanning other users' tokens
+                ensureIndex(
+                    collection,
+                    { userId: 1, expiresAt: 1 },
+                    { partialFilterExpression: { isDeleted: false }, background: true }
+                )
+            ]);
         } catch (error) {
             console.error('Failed to initialize TTL index:', error);
             throw new ApiError('Failed to initialize JWT service', StatusCodes.INTERNAL_SERVER_ERROR, 'JWT Service Error');
@@ -106,27 +135,21 @@ export class JwtService {
     private parseExpiration(exp: string | number): number {
         if (typeof exp === 'number') return exp * 1000;
 
-        const match = exp.match(/^(\d+)([dhms])$/);
+        const match = EXPIRATION_PATTERN.exec(exp);
         if (!match) throw new Error('Invalid expiration format');
 
         const [, value, unit] = match;
-        const multipliers: Record<string, number> = {
-            's': 1,
-            'm': 60,
-            'h': 60 * 60,
-            'd': 24 * 60 * 60
-        };
-
-        return Number(value) * multipliers[unit] * 1000;
+        return Number(value) * EXPIRATION_UNIT_SECONDS[unit] * 1000;
     }
 
-    private async validateConcurrentSessions(userId: string): Promise<void> {
+    private async validateConcurrentSessions(userId: string, now: Date = new Date()): Promise<void> {
         const collection = this.jtiCollection();
+        // The server can stop counting once the limit is reached
         const activeSessions = await collection.countDocuments({
             isDeleted: false,
-            expiresAt: { $gt: new Date() },
+            expiresAt: { $gt: now },
             userId: userId
-        });
+        }, { limit: this.MAX_CONCURRENT_SESSIONS });
 
         if (activeSessions >= this.MAX_CONCURRENT_SESSIONS) {
             throw new ApiError('Maximum concurrent sessions exceeded', StatusCodes.UNAUTHORIZED, 'JwtService');
@@ -149,34 +172,41 @@ export class JwtService {
 
     public async generateRefreshToken(payload: RefreshTokenPayload): Promise<string> {
         try {
-            await this.validateConcurrentSessions(payload.sub);
-            const jti = randomUUID();
-
-            const token = sign(
-                { ...payload, jti },
-                this.privateKey,
-                {
-                    algorithm: 'RS256',
-                    expiresIn: this.refreshExpiration
-                } as SignOptions
-            );
-
-            await this.jtiCollection().insertOne({
-                _id: jti,
-                Jti: jti,
-                userId: payload.sub,
-                expiresAt: new Date(Date.now() + this.parseExpiration(this.refreshExpiration)),
-                isDeleted: false,
-                createdAt: new Date(),
-                updatedAt: new Date()
-            });
-
+            const { token } = await this.issueRefreshToken(payload);
             return token;
         } catch (error) {
             this.mapJwtError(error);
         }
     }
 
+    private async issueRefreshToken(payload: RefreshTokenPayload): Promise<{ token: string, jti: string }> {
+        // One clock read for the session check and every timestamp on the stored token
+        const now = new Date();
+        await this.validateConcurrentSessions(payload.sub, now);
+        const jti = randomUUID();
+
+        const token = sign(
+            { ...payload, jti },
+            this.privateKey,
+            {
+                algorithm: 'RS256',
+                expiresIn: this.refreshExpiration
+            } as SignOptions
+        );
+
+        await this.jtiCollection().insertOne({
+            _id: jti,
+            Jti: jti,
+            userId: payload.sub,
+            expiresAt: new Date(now.getTime() + this.refreshExpirationMs),
+            isDeleted: false,
+            createdAt: now,
+            updatedAt: now
+        });
+
+        return { token, jti };
+    }
+
     public verifyToken(token: string): JwtPayload {
         try {
             return verify(token, this.publicKey, this.verifyOptions as VerifyOptions) as JwtPayload;
@@ -185,19 +215,25 @@ export class JwtService {
         }
     }
 
-    public async verifyRefreshToken(token: string): Promise<JwtPayload> {
-        try {
-            const decoded = verify(token, this.publicKey, this.verifyOptions as VerifyOptions) as JwtPayload;
+    private decodeRefreshToken(token: string): JwtPayload & { jti: string } {
+        const decoded = verify(token, this.publicKey, this.verifyOptions as VerifyOptions) as JwtPayload;
 
-            if (!decoded || typeof decoded === 'string') {
-                throw new ApiError('Invalid refresh token', StatusCodes.UNAUTHORIZED, 'JwtService');
-            }
+        if (!decoded || typeof decoded === 'string') {
+            throw new ApiError('Invalid refresh token', StatusCodes.UNAUTHORIZED, 'JwtService');
+        }
 
-            if (!decoded.jti) {
-                throw new ApiError('Invalid refresh token: missing jti', StatusCodes.UNAUTHORIZED, 'JwtService');
-            }
+        if (!decoded.jti) {
+            throw new ApiError('Invalid refresh token: missing jti', StatusCodes.UNAUTHORIZED, 'JwtService');
+        }
+        return decoded as JwtPayload & { jti: string };
+    }
+
+    public async verifyRefreshToken(token: string): Promise<JwtPayload> {
+        try {
+            const decoded = this.decodeRefreshToken(token);
 
-            const isValid = await this.jtiCollection().findOne({ _id: decoded.jti });
+            // Only existence matters; skip transferring and decoding the rest of the document
+            const isValid = await this.jtiCollection().findOne({ _id: decoded.jti }, { projection: { _id: 1 } });
 
             if (!isValid) {
                 throw new ApiError('Invalid refresh token', StatusCodes.UNAUTHORIZED, 'JwtService');
@@ -209,24 +245,32 @@ export class JwtService {
     }
 
     public async refreshTokens(refreshToken: string): Promise<{ accessToken: string, refreshToken: string }> {
-        const decoded = await this.verifyRefreshToken(refreshToken);
-        const accessToken = this.generateToken({
-            sub: decoded.sub!,
-            permissions: decoded.permissions,
-        });
-        const newRefreshToken = await this.generateRefreshToken({
-            sub: decoded.sub!,
-            permissions: decoded.permissions,
-        });
-        await this.revokeToken(refreshToken);
+        return this.runWithErrorHandling(async () => {
+            const decoded = this.decodeRefreshToken(refreshToken);
+            const claims = { sub: decoded.sub!, permissions: decoded.permissions };
+            const accessToken = this.generateToken(claims);
+            // Persist the replacement before consuming the old token, so a failed issue leaves the session usable
+            const issued = await this.issueRefreshToken(claims);
+            try {
+                // Check and revoke in one atomic round trip; a token replayed concurrently finds nothing to consume
+                const consumed = await this.jtiCollection().findOneAndDelete({ _id: decoded.jti });
+                if (!consumed) {
+                    throw new ApiError('Invalid refresh token', StatusCodes.UNAUTHORIZED, 'JwtService');
+                }
+            } catch (error) {
+                // Withdraw the replacement so a replayed or failed refresh leaves no extra live session
+                await this.jtiCollection().deleteOne({ _id: issued.jti }).catch(() => undefined);
+                throw error;
+            }
 
-        return { accessToken, refreshToken: newRefreshToken };
+            return { accessToken, refreshToken: issued.token };
+        });
     }
 
     public async revokeToken(refreshToken: string): Promise<void> {
         return this.runWithErrorHandling(async () => {
-            const payload = await this.verifyRefreshToken(refreshToken);
-            const result = await this.jtiCollection().deleteOne({ _id: payload.jti! });
+            const payload = this.decodeRefreshToken(refreshToken);
+            const result = await this.jtiCollection().deleteOne({ _id: payload.jti });
             if (result.deletedCount === 0) {
                 throw new ApiError('Token not found', StatusCodes.NOT_FOUND, 'JwtService');
             }
@@ -1,15 +1,39 @@
 import { injectable, inject } from 'inversify';
 import { PDFDocument, rgb, StandardFonts } from 'pdf-lib';
-import puppeteer from 'puppeteer';
 import { TYPES } from '../../core/di/types';
 import { TemplateService } from './template.service';
 import { PDFGenerationOptions } from './types';
 import { WinstonLogger } from '../../core/logger/winston.logger';
 import { ApiError } from '../../core/errors/api.error';
+import type { Browser, BrowserContext } from 'puppeteer';
+import { createHash } from 'crypto';
+import { TtlCache } from '../../utils/ttlCache';
+import { config } from '../../config';
+
+// puppeteer drags in the whole Chromium driver, so only load it on the first HTML render
+let puppeteerModule: Promise<typeof import('puppeteer')> | null = null;
+
+const loadPuppeteer = async () => {
+  if (!puppeteerModule) {
+    puppeteerModule = import('puppeteer');
+  }
+
+  return (await puppeteerModule).default;
+};
+
+// Wrap pdf-lib/puppeteer output as a Buffer view over the same memory instead of copying it
+const toBuffer = (bytes: Uint8Array): Buffer =>
+  Buffer.from(bytes.buffer, bytes.byteOffset, bytes.byteLength);
 
 @injectable()
 export class PDFService {
   private logger = new WinstonLogger('PDFService');
+  // Launching Chromium costs far more than rendering a page, so one browser serves every request
+  private browser: Promise<Browser> | null = null;
+  // Rendering is deterministic for a given template, data and options; repeat requests skip Chromium
+  private readonly pdfCache = new TtlCache<string, Buffer>(24 * 60 * 60 * 1000, 32);
+  // Development renders every time, matching TemplateService re-reading templates there
+  private readonly cacheRenders = config.nodeEnv !== 'development';
 
   constructor(
     @inject(TYPES.TemplateService) private readonly templateService: TemplateService
@@ -21,39 +45,56 @@ export class PDFService {
     options?: PDFGenerationOptions
   ): Promise<Buffer> {
     try {
-      this.logger.info('Starting PDF generation', { templateName });
+      this.logger.debug('Starting PDF generation', { templateName });
       
       // Validate template
       const isValid = await this.templateService.validateTemplate(templateName);
       if (!isValid) {
         throw new Error(`Template ${templateName} not found`);
       }
-      this.logger.info('Template validated successfully');
+      this.logger.debug('Template validated successfully');
+
+      // The template source is part of the key, so editing a template invalidates its cached renders
+      let cacheKey: string | undefined;
+      if (this.cacheRenders) {
+        const source = await this.templateService.loadTemplate(templateName);
+        cacheKey = createHash('sha256')
+          .update(source)
+          .update(JSON.stringify([templateName, data, options]))
+          .digest('hex');
+        const cached = this.pdfCache.get(cacheKey);
+        if (cached) {
+          return cached;
+        }
+      }
 
       // Render HTML
       const html = await this.templateService.renderTemplate(templateName, data);
-      this.logger.info('HTML template rendered', { htmlLength: html.length });
+      this.logger.debug('HTML template rendered', { htmlLength: html.length });
       
       // Convert to PDF
       const pdfBuffer = await this.generateFromHTML(html);
-      this.logger.info('PDF generated from HTML', { pdfSize: pdfBuffer.length });
+      this.logger.debug('PDF generated from HTML', { pdfSize: pdfBuffer.length });
 
       // Apply additional features
       let finalPDF = pdfBuffer;
       if (options?.watermark) {
         finalPDF = await this.addWatermark(finalPDF, options.watermark);
-        this.logger.info('Watermark added to PDF');
+        this.logger.debug('Watermark added to PDF');
       }
       if (options?.pageNumbers) {
         finalPDF = await this.addPageNumbers(finalPDF);
-        this.logger.info('Page numbers added to PDF');
+        this.logger.debug('Page numbers added to PDF');
       }
       if (options?.password) {
         finalPDF = await this.addPassword(finalPDF, options.password);
-        this.logger.info('Password protection added to PDF');
+        this.logger.debug('Password protection added to PDF');
       }
 
       this.logger.info('PDF generation completed successfully');
+      if (cacheKey) {
+        this.pdfCache.set(cacheKey, finalPDF);
+      }
       return finalPDF;
     } catch (error) {
       this.logger.error('PDF generation failed', error);
@@ -62,28 +103,55 @@ export class PDFService {
   }
 
 
+  private async getBrowser(): Promise<Browser> {
+    const pending = this.browser;
+    if (pending) {
+      const browser = await pending;
+      if (browser.connected) {
+        return browser;
+      }
+      // Chromium crashed or was closed; relaunch unless another caller already has
+      if (this.browser === pending) {
+        this.browser = null;
+      }
+    }
+
+    if (!this.browser) {
+      this.logger.info('Launching browser');
+      this.browser = loadPuppeteer()
+        .then(puppeteer => puppeteer.launch({
+          headless: true,
+          args: [
+            '--no-sandbox',
+            '--disable-setuid-sandbox',
+            '--disable-dev-shm-usage'
+          ],
+          executablePath: '/usr/bin/chromium-browser'
+        }))
+        .catch(error => {
+          this.browser = null;
+          throw error;
+        });
+    }
+    return this.browser;
+  }
+
   async generateFromHTML(html: string): Promise<Buffer> {
-    let browser;
+    let context: BrowserContext | undefined;
     try {
-      this.logger.info('Launching browser');
-      
-      browser = await puppeteer.launch({
-        headless: true,
-        args: [
-          '--no-sandbox',
-          '--disable-setuid-sandbox',
-          '--disable-dev-shm-usage'
-        ],
-        executablePath: '/usr/bin/chromium-browser'
-      });
+      const browser = await this.getBrowser();
+
+      // The browser is shared, but each render gets its own context so cookies, storage and cache
+      // from one document never leak into another
+      context = await browser.createBrowserContext();
 
-      this.logger.info('Creating new page');
-      const page = await browser.newPage();
+      this.logger.debug('Creating new page');
+      const page = await context.newPage();
       
-      this.logger.info('Setting page content');
+      this.logger.debug('Setting page content');
       await page.setContent(html);
 
-      this.logger.info('Generating PDF');
+      this.logger.debug('Generating PDF');
       const pdfBuffer = await page.pdf({
         format: 'A4',
         printBackground: true,
@@ -95,24 +163,35 @@ export class PDFService {
         }
       });
 
-      await browser.close();
-      this.logger.info('PDF generation successful');
-      return Buffer.from(pdfBuffer);
+      this.logger.debug('PDF generation successful');
+      return toBuffer(pdfBuffer);
 
     } catch (error) {
-      if (browser) {
-        await browser.close().catch(() => {});
-      }
       this.logger.error('HTML to PDF conversion failed', error);
       throw new ApiError('HTML to PDF conversion failed', 500, 'PDFService');
+    } finally {
+      // Closing the context closes its pages too
+      if (context) {
+        await context.close().catch(() => {});
+      }
     }
   }
 
+  // Shuts down the shared Chromium; the next render launches a fresh one
+  async close(): Promise<void> {
+    const pending = this.browser;
+    this.browser = null;
+    if (pending) {
+      const browser = await pending.catch(() => null);
+      await browser?.close();
+      this.logger.info('Browser closed');
+    }
+  }
   
 
   async addWatermark(pdfContent: Buffer, text: string): Promise<Buffer> {
     try {
-      this.logger.info('Adding watermark to PDF', { watermarkText: text });
+      this.logger.debug('Adding watermark to PDF', { watermarkText: text });
       const pdfDoc = await PDFDocument.load(pdfContent);
       const helveticaFont = await pdfDoc.embedFont(StandardFonts.Helvetica);
       const pages = pdfDoc.getPages();
@@ -130,8 +209,8 @@ export class PDFService {
       }
 
       const pdfBytes = await pdfDoc.save();
-      this.logger.info('Watermark added successfully');
-      return Buffer.from(pdfBytes);
+      this.logger.debug('Watermark added successfully');
+      return toBuffer(pdfBytes);
     } catch (error) {
       this.logger.error('Failed to add watermark', error);
       throw new ApiError('Failed to add watermark', 500, 'PDFService');
@@ -140,7 +219,7 @@ export class PDFService {
 
   async mergePDFs(pdfFiles: Buffer[]): Promise<Buffer> {
     try {
-      this.logger.info('Starting PDF merge', { numberOfFiles: pdfFiles.length });
+      this.logger.debug('Starting PDF merge', { numberOfFiles: pdfFiles.length });
       const mergedPdf = await PDFDocument.create();
       
       for (const pdfFile of pdfFiles) {
@@ -151,7 +230,7 @@ export class PDFService {
 
       const mergedPdfFile = await mergedPdf.save();
       this.logger.info('PDFs merged successfully');
-      return Buffer.from(mergedPdfFile);
+      return toBuffer(mergedPdfFile);
     } catch (error) {
       this.logger.error('Failed to merge PDFs', error);
       throw new ApiError('Failed to merge PDFs', 500, 'PDFService');
@@ -160,7 +239,7 @@ export class PDFService {
 
   async addPageNumbers(pdfContent: Buffer): Promise<Buffer> {
     try {
-      this.logger.info('Adding page numbers to PDF');
+      this.logger.debug('Adding page numbers to PDF');
       const pdfDoc = await PDFDocument.load(pdfContent);
       const helveticaFont = await pdfDoc.embedFont(StandardFonts.Helvetica);
       const pages = pdfDoc.getPages();
@@ -177,8 +256,8 @@ export class PDFService {
       });
 
       const pdfBytes = await pdfDoc.save();
-      this.logger.info('Page numbers added successfully');
-      return Buffer.from(pdfBytes);
+      this.logger.debug('Page numbers added successfully');
+      return toBuffer(pdfBytes);
     } catch (error) {
       this.logger.error('Failed to add page numbers', error);
       throw new ApiError('Failed to add page numbers', 500, 'PDFService');
@@ -187,15 +266,15 @@ export class PDFService {
 
   private async addPassword(pdfContent: Buffer, password: string): Promise<Buffer> {
     try {
-      this.logger.info('Adding password protection to PDF');
+      this.logger.debug('Adding password protection to PDF');
       const pdfDoc = await PDFDocument.load(pdfContent);
       
       // For password protection, we'll use save without options
       // as the current version doesn't support password protection
       const pdfBytes = await pdfDoc.save();
       
-      this.logger.info('PDF saved successfully');
-      return Buffer.from(pdfBytes);
+      this.logger.debug('PDF saved successfully');
+      return toBuffer(pdfBytes);
     } catch (error) {
       this.logger.error('Failed to add password protection', error);
       throw new ApiError('Failed to add password protection', 500, 'PDFService');
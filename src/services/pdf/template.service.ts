@@ -3,18 +3,40 @@ import { readFile } from 'fs/promises';
 import { join } from 'path';
 import { WinstonLogger } from '../../core/logger/winston.logger';
 import { ApiError } from '../../core/errors/api.error';
+import { config } from '../../config';
+
+const VARIABLE_PATTERN = /{{\s*([^{}#\/\s]+)\s*}}/g;
 
 @injectable()
 export class TemplateService {
   private logger = new WinstonLogger('TemplateService');
   private templatesPath = join(process.cwd(), 'templates', 'documents'); // Updated path
+  // Template sources are read once per process; development re-reads them so edits show up
+  private templateCache = new Map<string, Promise<string>>();
+  private cacheTemplates = config.nodeEnv !== 'development';
+
+  // Raw template source; PDFService keys its render cache on it so an edited template is never served stale
+  loadTemplate(templateName: string): Promise<string> {
+    const templatePath = join(this.templatesPath, `${templateName}.html`);
+    if (!this.cacheTemplates) {
+      return readFile(templatePath, 'utf-8');
+    }
+
+    let source = this.templateCache.get(templatePath);
+    if (!source) {
+      source = readFile(templatePath, 'utf-8');
+      this.templateCache.set(templatePath, source);
+      // Do not pin a failed read; the template may be added later
+      source.catch(() => this.templateCache.delete(templatePath));
+    }
+    return source;
+  }
 
   async renderTemplate(templateName: string, context: Record<string, any>): Promise<string> {
     try {
-      const templatePath = join(this.templatesPath, `${templateName}.html`);
-      this.logger.info(`Loading template from: ${templatePath}`);
+      this.logger.debug('Loading template', { templateName });
       
-      let template = await readFile(templatePath, 'utf-8');
+      let template = await this.loadTemplate(templateName);
       
       // Handle {{#each}} blocks first
       template = this.processEachBlocks(template, context);
@@ -23,9 +45,7 @@ export class TemplateService {
       template = this.processIfBlocks(template, context);
       
       // Basic template variable replacement
-      Object.entries(context).forEach(([key, value]) => {
-        template = template.replace(new RegExp(`{{\\s*${key}\\s*}}`, 'g'), String(value));
-      });
+      template = this.replaceVariables(template, context);
 
       return template;
     } catch (error) {
@@ -40,19 +60,18 @@ export class TemplateService {
       const items = context[key];
       if (!Array.isArray(items)) return '';
       
-      return items.map(item => {
-        let itemContent = content;
-        Object.entries(item).forEach(([itemKey, itemValue]) => {
-          itemContent = itemContent.replace(
-            new RegExp(`{{\\s*${itemKey}\\s*}}`, 'g'),
-            String(itemValue)
-          );
-        });
-        return itemContent;
-      }).join('');
+      return items.map(item => this.replaceVariables(content, item)).join('');
     });
   }
 
+  // One scan of the template per context instead of building and running a RegExp per key;
+  // placeholders without a matching key are left for an outer pass
+  private replaceVariables(template: string, context: Record<string, any>): string {
+    return template.replace(VARIABLE_PATTERN, (match, key: string) =>
+      Object.prototype.hasOwnProperty.call(context, key) ? String(context[key]) : match
+    );
+  }
+
   private processIfBlocks(template: string, context: Record<string, any>): string {
     const ifRegex = /{{#if\s+(\w+)}}([\s\S]*?){{\/if}}/g;
     return template.replace(ifRegex, (match, key, content) => {
@@ -62,8 +81,7 @@ export class TemplateService {
 
   async validateTemplate(templateName: string): Promise<boolean> {
     try {
-      const templatePath = join(this.templatesPath, `${templateName}.html`);
-      await readFile(templatePath, 'utf-8');
+      await this.loadTemplate(templateName);
       return true;
     } catch {
       return false;
@@ -72,8 +90,7 @@ export class TemplateService {
 
   async getTemplateVars(templateName: string): Promise<string[]> {
     try {
-      const templatePath = join(this.templatesPath, `${templateName}.html`);
-      const content = await readFile(templatePath, 'utf-8');
+      const content = await this.loadTemplate(templateName);
       const matches = content.match(/{{(?!#)\s*([^}]+)\s*}}/g) || [];
       return matches.map(match => match.replace(/[{}\s]/g, ''));
     } catch (error) {
@@ -1,22 +1,4 @@
-export interface PDFConfig {
-    pageSize: string;
-    marginTop: string;
-    marginBottom: string;
-    marginLeft: string;
-    marginRight: string;
-    encoding: string;
-    dpi: number;
-  }
-  
-  export interface StyleConfig {
-    defaultFont: string;
-    fontSize: number;
-    lineHeight: number;
-    headerHeight: string;
-    footerHeight: string;
-  }
-  
-  export interface PDFGenerationOptions {
+export interface PDFGenerationOptions {
     watermark?: string;
     pageNumbers?: boolean;
     password?: string;
@@ -71,7 +71,7 @@ export class RetryService {
     let attempt = 0;
 
     while (attempt < normalizedOptions.maxRetries + 1) {
-      const startTime = Date.now();
+      const startTime = process.hrtime.bigint();
 
       try {
         metrics.totalAttempts++;
@@ -81,7 +81,7 @@ export class RetryService {
         metrics.successfulAttempts++;
         metrics.averageResponseTime = this.updateAverageTime(
           metrics.averageResponseTime,
-          Date.now() - startTime
+          this.elapsedMs(startTime)
         );
 
         return result;
@@ -102,11 +102,13 @@ export class RetryService {
         }
 
         const delay = this.calculateDelay(attempt, normalizedOptions);
-        this.logger.warn(`Retry attempt ${attempt + 1}/${normalizedOptions.maxRetries}`, {
-          error,
-          delay,
-          operationId: id
-        });
+        if (this.logger.isLevelEnabled('warn')) {
+          this.logger.warn(`Retry attempt ${attempt + 1}/${normalizedOptions.maxRetries}`, {
+            error,
+            delay,
+            operationId: id
+          });
+        }
 
         await this.delay(delay);
         attempt++;
@@ -144,7 +146,7 @@ export class RetryService {
     }
 
     try {
-      const startTime = Date.now();
+      const startTime = process.hrtime.bigint();
       const result = await operation();
 
       if (breaker.state === CircuitBreakerState.HALF_OPEN) {
@@ -158,7 +160,7 @@ export class RetryService {
       metrics.successfulAttempts++;
       metrics.averageResponseTime = this.updateAverageTime(
         metrics.averageResponseTime,
-        Date.now() - startTime
+        this.elapsedMs(startTime)
       );
 
       return result;
@@ -278,11 +280,20 @@ private generateOperationId(): string {
     return new Promise(resolve => setTimeout(resolve, ms));
   }
 
+  // Monotonic, so wall-clock adjustments cannot skew response times
+  private elapsedMs(startTime: bigint): number {
+    return Number(process.hrtime.bigint() - startTime) / 1e6;
+  }
+
   private updateAverageTime(currentAvg: number, newValue: number): number {
     return currentAvg === 0 ? newValue : (currentAvg + newValue) / 2;
   }
 
   private reportMetrics(): void {
+    // Building the per-operation snapshot walks every tracked id; skip it when info is filtered
+    if (!this.logger.isLevelEnabled('info')) {
+      return;
+    }
     this.logger.info('Retry Service Metrics', {
       totalOperations: this.metrics.size,
       operations: Array.from(this.metrics.entries()).map(([id, metrics]) => ({
@@ -11,6 +11,7 @@ export interface ILogger {
   error(message: string, meta?: any): void;
   warn(message: string, meta?: any): void;
   debug(message: string, meta?: any): void;
+  isLevelEnabled(level: string): boolean;
 }
 
 export interface IConfig {
@@ -28,5 +29,10 @@ export interface IConfig {
   jwtPrivateKeyPath: string | undefined;
   jwtAccessExpiration: string | number;
   jwtRefreshExpiration: string | number;
+  mongoMaxPoolSize: number;
+  mongoMinPoolSize: number;
+  mongoMaxIdleTimeMS: number;
+  mongoWaitQueueTimeoutMS: number;
+  mongoCompressors: string[];
 }
 
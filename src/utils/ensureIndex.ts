@@ -0,0 +1,32 @@
+import { Collection, CreateIndexesOptions, Document, IndexSpecification } from 'mongodb';
+
+// createIndex is a server round trip even when the index already exists; remember each spec per
+// namespace, since every db().collection() call returns a new handle for the same collection
+const ensuredIndexes = new Map<string, Map<string, Promise<string>>>();
+
+export const ensureIndex = <T extends Document>(
+  collection: Collection<T>,
+  keys: IndexSpecification,
+  options: CreateIndexesOptions = {}
+): Promise<string> => {
+  let indexes = ensuredIndexes.get(collection.namespace);
+  if (!indexes) {
+    indexes = new Map();
+    ensuredIndexes.set(collection.namespace, indexes);
+  }
+
+  const cacheKey = JSON.stringify([keys, options]);
+  let pending = indexes.get(cacheKey);
+  if (!pending) {
+    const cache = indexes;
+    pending = new Promise<string>(resolve => resolve(collection.createIndex(keys, options)))
+      .catch(error => {
+        // Let the next caller retry instead of caching the failure
+        cache.delete(cacheKey);
+        throw error;
+      });
+    cache.set(cacheKey, pending);
+  }
+
+  return pending;
+};
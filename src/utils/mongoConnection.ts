@@ -1,5 +1,18 @@
 import { WinstonLogger } from '@gateway/core/logger/winston.logger';
-import { MongoClient } from 'mongodb';
+import { config } from '@gateway/config';
+import { CompressorName, MongoClient, MongoClientOptions } from 'mongodb';
+
+// Every repository and service shares this client, so size its pool for the whole process
+export const MONGO_POOL_OPTIONS: MongoClientOptions = {
+  maxPoolSize: config.mongoMaxPoolSize,
+  minPoolSize: config.mongoMinPoolSize,
+  maxIdleTimeMS: config.mongoMaxIdleTimeMS,
+  // Fail fast instead of queueing requests indefinitely when the pool is exhausted
+  waitQueueTimeoutMS: config.mongoWaitQueueTimeoutMS,
+  // Negotiated with the server in order of preference; zlib ships with Node, zstd/snappy need their optional
+  // packages installed. Set MONGO_COMPRESSORS=none to turn compression off
+  compressors: config.mongoCompressors as CompressorName[]
+};
 
 export interface IMongoConnection {
   connect(): Promise<void>;
@@ -10,17 +23,27 @@ export interface IMongoConnection {
 
 export class MongoConnection implements IMongoConnection {
   private client: MongoClient | null = null;
+  private connecting: Promise<void> | null = null;
   private logger = new WinstonLogger('MongoDB');
   private static instance: MongoConnection;
 
   private constructor() { } // Make constructor private for singleton pattern
 
   async connect(): Promise<void> {
+    // Concurrent callers reuse the same client instead of opening a second pool
+    if (!this.connecting) {
+      this.connecting = this.createClient();
+    }
+    return this.connecting;
+  }
+
+  private async createClient(): Promise<void> {
     try {
-      this.client = new MongoClient(process.env.MONGO_URI!);
+      this.client = new MongoClient(process.env.MONGO_URI!, MONGO_POOL_OPTIONS);
       await this.client.connect();
       this.logger.info('Connected to MongoDB');
     } catch (error) {
+      this.connecting = null;
       this.logger.error('MongoDB connection failed', error);
       throw error;
     }
@@ -37,6 +60,7 @@ export class MongoConnection implements IMongoConnection {
     if (this.client) {
       await this.client.close();
       this.client = null;
+      this.connecting = null;
       console.log('Disconnected from MongoDB');
     }
   }
@@ -0,0 +1,13 @@
+import { AsyncLocalStorage } from 'async_hooks';
+
+export interface RequestContext {
+  // Read results memoized for the lifetime of one request, keyed by collection namespace then query
+  queryCache: Map<string, Map<string, Promise<unknown>>>;
+}
+
+const storage = new AsyncLocalStorage<RequestContext>();
+
+export const runWithRequestContext = <R>(fn: () => R): R =>
+  storage.run({ queryCache: new Map() }, fn);
+
+export const getRequestContext = (): RequestContext | undefined => storage.getStore();
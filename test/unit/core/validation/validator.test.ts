@@ -57,6 +57,11 @@ describe('StandardValidators', () => {
       expect(email('test domain@test.com')).toBe(false);
     });
 
+    it('should reject a long domain without a dot', () => {
+      expect(email(`test@${'a'.repeat(50000)}`)).toBe(false);
+      expect(email('test@example.com\u00a0')).toBe(false);
+    });
+
     it('should return false for non-string values', () => {
       expect(email(123)).toBe(false);
       expect(email(null)).toBe(false);
@@ -1,5 +1,6 @@
 import { MongoClient, Collection, ObjectId } from 'mongodb';
 import { BaseRepository } from '../../../src/repositories/BaseRepository';
+import { runWithRequestContext } from '../../../src/utils/requestContext';
 
 interface TestDocument {
   _id?: string | ObjectId;
@@ -62,6 +63,31 @@ describe('BaseRepository', () => {
     expect(doc.updatedAt).toBeDefined();
   });
 
+  it('should mark created documents as not deleted by default', async () => {
+    const doc = await repository.create({ name: 'test' });
+    expect(doc.isDeleted).toBe(false);
+    expect(await repository.findOne({ _id: doc._id })).not.toBeNull();
+  });
+
+  it('should create many documents', async () => {
+    const inserted = await repository.createMany([
+      { name: 'test1', isDeleted: false },
+      { name: 'test2', isDeleted: false },
+    ]);
+    expect(inserted).toBe(2);
+    expect(await repository.count({})).toBe(2);
+  });
+
+  it('should apply mixed bulk operations', async () => {
+    const doc = await repository.create({ name: 'test', isDeleted: false });
+    const result = await repository.bulkWrite([
+      { updateOne: { filter: { _id: doc._id }, update: { $set: { name: 'updated' } } } },
+      { deleteOne: { filter: { name: 'missing' } } },
+    ]);
+    expect(result?.modifiedCount).toBe(1);
+    expect((await repository.findOne({ _id: doc._id }))?.name).toBe('updated');
+  });
+
   it('should find document', async () => {
     const created = await repository.create({
       name: 'test',
@@ -90,6 +116,19 @@ describe('BaseRepository', () => {
     expect(found).toBeNull();
   });
 
+  it('should stream matching documents', async () => {
+    await repository.createMany([
+      { name: 'test1', isDeleted: false },
+      { name: 'test2', isDeleted: false },
+    ]);
+
+    const names: string[] = [];
+    for await (const doc of repository.iterate({}, { sort: { name: 1 } })) {
+      names.push(doc.name);
+    }
+    expect(names).toEqual(['test1', 'test2']);
+  });
+
   it('should paginate results', async () => {
     await Promise.all([
       repository.create({ name: 'test1', isDeleted: false }),
@@ -101,4 +140,73 @@ describe('BaseRepository', () => {
     expect(items.length).toBe(2);
     expect(total).toBe(3);
   });
-});
\ No newline at end of file
+
+  describe('request-scoped findOne memo', () => {
+    afterEach(() => {
+      jest.restoreAllMocks();
+    });
+
+    it('should query the server once per identical lookup within a request', async () => {
+      const doc = await repository.create({ name: 'test', isDeleted: false });
+      const findOneSpy = jest.spyOn(collection, 'findOne');
+
+      await runWithRequestContext(async () => {
+        const [first, second] = await Promise.all([
+          repository.findOne({ _id: doc._id }),
+          repository.findOne({ _id: doc._id }),
+        ]);
+        expect(first?.name).toBe('test');
+        expect(second?.name).toBe('test');
+      });
+      expect(findOneSpy).toHaveBeenCalledTimes(1);
+    });
+
+    it('should hand each caller its own copy', async () => {
+      const doc = await repository.create({ name: 'test', isDeleted: false });
+
+      await runWithRequestContext(async () => {
+        const first = await repository.findOne({ _id: doc._id });
+        first!.name = 'mutated';
+        const second = await repository.findOne({ _id: doc._id });
+        expect(second?.name).toBe('test');
+      });
+    });
+
+    it('should drop memoized results after a write', async () => {
+      const doc = await repository.create({ name: 'test', isDeleted: false });
+
+      await runWithRequestContext(async () => {
+        expect((await repository.findOne({ _id: doc._id }))?.name).toBe('test');
+        await repository.update(doc._id.toString(), { name: 'updated' });
+        expect((await repository.findOne({ _id: doc._id }))?.name).toBe('updated');
+        await repository.delete(doc._id.toString());
+        expect(await repository.findOne({ _id: doc._id })).toBeNull();
+      });
+    });
+
+    it('should not memoize outside a request', async () => {
+      const doc = await repository.create({ name: 'test', isDeleted: false });
+      const findOneSpy = jest.spyOn(collection, 'findOne');
+
+      await repository.findOne({ _id: doc._id });
+      await repository.findOne({ _id: doc._id });
+      expect(findOneSpy).toHaveBeenCalledTimes(2);
+    });
+
+    it('should keep concurrent requests isolated', async () => {
+      const doc = await repository.create({ name: 'test', isDeleted: false });
+      const findOneSpy = jest.spyOn(collection, 'findOne');
+
+      const [first, second] = await Promise.all([
+        runWithRequestContext(() => repository.findOne({ _id: doc._id })),
+        runWithRequestContext(async () => {
+          await repository.update(doc._id.toString(), { name: 'updated' });
+          return repository.findOne({ _id: doc._id });
+        }),
+      ]);
+      expect(findOneSpy).toHaveBeenCalledTimes(2);
+      expect(first).not.toBe(second);
+      expect(second?.name).toBe('updated');
+    });
+  });
+});
@@ -14,11 +14,15 @@ jest.mock('@gateway/utils/mongoConnection', () => ({
 describe('UserRepository', () => {
     let userRepository: UserRepository;
     let mockCollection: jest.Mocked<Collection<IUser>>;
+    // ensureIndex remembers specs per namespace, so each test gets a collection it has not seen
+    let collectionCount = 0;
 
     beforeEach(() => {
         mockCollection = {
+            namespace: `test.users_${++collectionCount}`,
             findOne: jest.fn(),
             updateOne: jest.fn(),
+            updateMany: jest.fn().mockResolvedValue({ modifiedCount: 0 }),
             createIndex: jest.fn(),
             deleteMany: jest.fn(),
             aggregate: jest.fn(),
@@ -60,6 +64,48 @@ describe('UserRepository', () => {
             const result = await userRepository.findByEmail('notfound@example.com');
             expect(result).toBeNull();
         });
+
+        it('should query active users by lowercased email without pinning an index', async () => {
+            (mockCollection.findOne as jest.Mock).mockResolvedValueOnce(null);
+            await userRepository.findByEmail('Test@Example.com');
+            expect(mockCollection.findOne).toHaveBeenCalledWith({ email: 'test@example.com', isDeleted: false });
+        });
+
+        it('should backfill isDeleted before looking up the user', async () => {
+            (mockCollection.findOne as jest.Mock).mockResolvedValueOnce(null);
+            await userRepository.findByEmail('test@example.com');
+            expect(mockCollection.updateMany).toHaveBeenCalledWith(
+                { isDeleted: { $exists: false } },
+                { $set: { isDeleted: false } }
+            );
+            expect((mockCollection.updateMany as jest.Mock).mock.invocationCallOrder[0])
+                .toBeLessThan((mockCollection.findOne as jest.Mock).mock.invocationCallOrder[0]);
+        });
+
+        it('should find users while the email index is missing', async () => {
+            const mockUser = { email: 'test@example.com', isDeleted: false } as IUser;
+            Object.assign(mockCollection, {
+                namespace: `test.users_${++collectionCount}`,
+                createIndex: jest.fn().mockRejectedValue(new Error('index build failed'))
+            });
+            (mockCollection.findOne as jest.Mock).mockResolvedValueOnce(mockUser);
+            const consoleSpy = jest.spyOn(console, 'error').mockImplementation(() => undefined);
+            userRepository = new UserRepository();
+            const result = await userRepository.findByEmail('test@example.com');
+            expect(result).toEqual(mockUser);
+            consoleSpy.mockRestore();
+        });
+
+        it('should still find users when the backfill fails', async () => {
+            const mockUser = { email: 'test@example.com', isDeleted: false } as IUser;
+            (mockCollection.updateMany as jest.Mock).mockRejectedValueOnce(new Error('backfill failed'));
+            (mockCollection.findOne as jest.Mock).mockResolvedValueOnce(mockUser);
+            const consoleSpy = jest.spyOn(console, 'error').mockImplementation(() => undefined);
+            userRepository = new UserRepository();
+            const result = await userRepository.findByEmail('test@example.com');
+            expect(result).toEqual(mockUser);
+            consoleSpy.mockRestore();
+        });
     });
 
     describe('incrementFailedAttempts', () => {
@@ -161,8 +207,9 @@ describe('UserRepository', () => {
 
         it('should handle invalid ObjectId', async () => {
             await expect(userRepository.findById('not-an-object-id')).rejects.toThrow(
-                new ApiError('Cannot connect to database', StatusCodes.INTERNAL_SERVER_ERROR, 'UserRepository')
+                new ApiError('Invalid user ID format', StatusCodes.BAD_REQUEST, 'UserRepository')
             );
+            expect(mockCollection.findOne).not.toHaveBeenCalled();
         });
 
         it('should handle database errors in findById', async () => {
@@ -242,6 +289,44 @@ describe('UserRepository', () => {
         });
     });
 
+    describe('createUsers', () => {
+        it('should insert the batch once and report repeated emails', async () => {
+            (mockCollection as any).insertMany = jest.fn().mockResolvedValueOnce({ insertedCount: 2 });
+
+            const result = await userRepository.createUsers([
+                { email: 'One@example.com' },
+                { email: 'two@example.com' },
+                { email: 'one@example.com' }
+            ] as Partial<IUser>[]);
+
+            expect((mockCollection as any).insertMany).toHaveBeenCalledTimes(1);
+            expect((mockCollection as any).insertMany.mock.calls[0][0]).toHaveLength(2);
+            expect(result).toEqual({ insertedCount: 2, duplicateEmails: ['one@example.com'] });
+        });
+    });
+
+    describe('findByIds', () => {
+        it('should fetch all users in one query and keep the requested order', async () => {
+            const first = { _id: new ObjectId(), email: 'a@example.com' };
+            const second = { _id: new ObjectId(), email: 'b@example.com' };
+            const cursor = {
+                batchSize: jest.fn().mockReturnThis(),
+                toArray: jest.fn().mockResolvedValueOnce([first, second])
+            };
+            (mockCollection as any).find = jest.fn().mockReturnValue(cursor);
+
+            const result = await userRepository.findByIds([second._id.toString(), new ObjectId(), first._id]);
+
+            expect((mockCollection as any).find).toHaveBeenCalledTimes(1);
+            expect(result).toEqual([second, first]);
+        });
+
+        it('should reject malformed ids with a bad request', async () => {
+            await expect(userRepository.findByIds(['not-an-object-id']))
+                .rejects.toThrow(new ApiError('Invalid user ID format', StatusCodes.BAD_REQUEST, 'UserRepository'));
+        });
+    });
+
     describe('getInactivityTime', () => {
         it('should return inactivity time from aggregate result', async () => {
             const userId = new ObjectId().toString();
@@ -303,5 +388,58 @@ describe('UserRepository', () => {
                 { expireAfterSeconds: 60 * 60 * 24 * 30, background: true }
             );
         });
+
+        it('should backfill isDeleted before building the partial email index', async () => {
+            await new Promise(resolve => setImmediate(resolve));
+
+            expect(mockCollection.updateMany).toHaveBeenCalledWith(
+                { isDeleted: { $exists: false } },
+                { $set: { isDeleted: false } }
+            );
+            expect(mockCollection.createIndex).toHaveBeenCalledWith(
+                { email: 1 },
+                { unique: true, partialFilterExpression: { isDeleted: false }, name: 'uniq_email_active' }
+            );
+            const backfillOrder = (mockCollection.updateMany as jest.Mock).mock.invocationCallOrder[0];
+            const emailIndexCall = (mockCollection.createIndex as jest.Mock).mock.calls
+                .findIndex(([keys]) => 'email' in keys);
+            expect(backfillOrder)
+                .toBeLessThan((mockCollection.createIndex as jest.Mock).mock.invocationCallOrder[emailIndexCall]);
+        });
+
+        it('should refuse to create users while the email index cannot be built', async () => {
+            Object.assign(mockCollection, {
+                namespace: `test.users_${++collectionCount}`,
+                createIndex: jest.fn().mockRejectedValue(new Error('Index build failed'))
+            });
+            const consoleError = jest.spyOn(console, 'error').mockImplementation(() => undefined);
+            const repository = new UserRepository();
+
+            await expect(repository.create({ email: 'new@example.com' }))
+                .rejects.toMatchObject({ statusCode: StatusCodes.SERVICE_UNAVAILABLE, source: 'UserRepository' });
+            expect(mockCollection.insertOne).not.toHaveBeenCalled();
+            consoleError.mockRestore();
+        });
+
+        it('should retry a failed email index build on the next create', async () => {
+            let emailIndexBuilds = 0;
+            Object.assign(mockCollection, {
+                namespace: `test.users_${++collectionCount}`,
+                createIndex: jest.fn().mockImplementation(keys => 'email' in keys && ++emailIndexBuilds === 1
+                    ? Promise.reject(new Error('Index build failed'))
+                    : Promise.resolve('ok'))
+            });
+            (mockCollection.insertOne as jest.Mock).mockResolvedValueOnce({ insertedId: new ObjectId() });
+            const consoleError = jest.spyOn(console, 'error').mockImplementation(() => undefined);
+            const repository = new UserRepository();
+
+            await repository.create({ email: 'New@Example.com' });
+
+            const emailIndexCalls = (mockCollection.createIndex as jest.Mock).mock.calls
+                .filter(([keys]) => 'email' in keys);
+            expect(emailIndexCalls).toHaveLength(2);
+            expect(mockCollection.insertOne).toHaveBeenCalledWith(expect.objectContaining({ email: 'new@example.com' }));
+            consoleError.mockRestore();
+        });
     });
 });
\ No newline at end of file
@@ -68,9 +68,15 @@ describe('AuthService', () => {
 
             await authService.login('test@example.com', 'Password123@', { userAgent: 'test-agent' });
 
-            expect(userRepository.resetFailedAttempts).toHaveBeenCalled();
-            expect(userRepository.updateLastLogin).toHaveBeenCalled();
+            expect(userRepository.resetFailedAttempts).not.toHaveBeenCalled();
+            // createSession records the login; nothing else writes it again
+            expect(userRepository.updateLastLogin).not.toHaveBeenCalled();
             expect(sessionService.createSession).toHaveBeenCalled();
+
+            userRepository.findByEmail.mockResolvedValue({ ...mockUser, failedLoginAttempts: 2 });
+            await authService.login('test@example.com', 'Password123@', { userAgent: 'test-agent' });
+
+            expect(userRepository.resetFailedAttempts).toHaveBeenCalledWith(mockUser._id);
         });
 
         it('should throw on user not found', async () => {
@@ -160,7 +166,7 @@ describe('AuthService', () => {
                 .rejects
                 .toThrow(new ApiError('Invalid credentials', StatusCodes.UNAUTHORIZED, 'AuthService'));
 
-            expect(userRepository.incrementFailedAttempts).toHaveBeenCalledWith(mockUser._id!.toString());
+            expect(userRepository.incrementFailedAttempts).toHaveBeenCalledWith(mockUser._id);
         });
 
         it('should handle login with device info', async () => {
@@ -322,14 +328,14 @@ describe('AuthService', () => {
                 profile: {}
             };
 
-            (userRepository.findByEmail as jest.Mock).mockResolvedValue({
-                _id: new ObjectId() as unknown as ObjectId,
-                email: reqBody.email,
-                password: 'hashedPassword',
-            });
+            (passwordService.hashPassword as jest.Mock).mockResolvedValue('hashedPassword');
+            (userRepository.create as jest.Mock).mockRejectedValue(
+                new ApiError('User already exists', StatusCodes.CONFLICT, 'UserRepository')
+            );
             await expect(authService.signup(reqBody))
                 .rejects
-                .toThrow(new ApiError('User already exists', StatusCodes.CONFLICT, 'AuthService'));
+                .toMatchObject({ message: 'User already exists', statusCode: StatusCodes.BAD_REQUEST, source: 'AuthService' });
+            expect(userRepository.findByEmail).not.toHaveBeenCalled();
         });
 
         it('should successfully signup a user', async () => {
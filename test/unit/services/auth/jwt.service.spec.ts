@@ -61,6 +61,7 @@ describe('JwtService', () => {
             findOne: jest.fn().mockResolvedValue(null),
             insertOne: jest.fn().mockResolvedValue({ acknowledged: true }),
             deleteOne: jest.fn().mockResolvedValue({ deletedCount: 1 }),
+            findOneAndDelete: jest.fn().mockResolvedValue(null),
             countDocuments: jest.fn().mockResolvedValue(0)
         };
 
@@ -175,15 +176,44 @@ describe('JwtService', () => {
     describe('refreshTokens', () => {
         it('should refresh access and refresh tokens if refresh token is valid', async () => {
             const payload: RefreshTokenPayload = { sub: 'user123', permissions: ['read'] };
-            mockCollection.findOne.mockResolvedValue({ _id: 'test-jti' });
-            mockCollection.deleteOne.mockResolvedValue({ deletedCount: 1 });
+            mockCollection.findOneAndDelete.mockResolvedValue({ _id: 'test-jti' });
             const token = sign({ ...payload, jti: 'test-jti' }, privateKey, { algorithm: 'RS256', expiresIn: '7d' });
             const tokens = await jwtService.refreshTokens(token);
+            expect(mockCollection.findOneAndDelete).toHaveBeenCalledWith({ _id: 'test-jti' });
             expect(tokens).toHaveProperty('accessToken');
             expect(tokens).toHaveProperty('refreshToken');
             const decodedAccess = verify(tokens.accessToken, publicKey, { algorithms: ['RS256'] }) as JwtPayload;
             expect(decodedAccess.sub).toEqual(payload.sub);
         });
+
+        it('should reject a refresh token that was already used', async () => {
+            const payload: RefreshTokenPayload = { sub: 'user123', permissions: ['read'] };
+            mockCollection.findOneAndDelete.mockResolvedValue(null);
+            const token = sign({ ...payload, jti: 'test-jti' }, privateKey, { algorithm: 'RS256', expiresIn: '7d' });
+            await expect(jwtService.refreshTokens(token))
+                .rejects.toEqual(new ApiError('Invalid refresh token', StatusCodes.UNAUTHORIZED, 'JwtService'));
+            const issuedJti = mockCollection.insertOne.mock.calls[0][0]._id;
+            expect(mockCollection.deleteOne).toHaveBeenCalledWith({ _id: issuedJti });
+        });
+
+        it('should keep the old refresh token when issuing the new one fails', async () => {
+            const payload: RefreshTokenPayload = { sub: 'user123', permissions: ['read'] };
+            mockCollection.insertOne.mockRejectedValue(new Error('write failed'));
+            const token = sign({ ...payload, jti: 'test-jti' }, privateKey, { algorithm: 'RS256', expiresIn: '7d' });
+            await expect(jwtService.refreshTokens(token))
+                .rejects.toEqual(new ApiError('JWT Service Error', StatusCodes.INTERNAL_SERVER_ERROR, 'JwtService'));
+            expect(mockCollection.findOneAndDelete).not.toHaveBeenCalled();
+            expect(mockCollection.deleteOne).not.toHaveBeenCalled();
+        });
+
+        it('should keep the old refresh token when the session limit is reached', async () => {
+            const payload: RefreshTokenPayload = { sub: 'user123', permissions: ['read'] };
+            mockCollection.countDocuments.mockResolvedValue(jwtService['MAX_CONCURRENT_SESSIONS']);
+            const token = sign({ ...payload, jti: 'test-jti' }, privateKey, { algorithm: 'RS256', expiresIn: '7d' });
+            await expect(jwtService.refreshTokens(token))
+                .rejects.toEqual(new ApiError('Maximum concurrent sessions exceeded', StatusCodes.UNAUTHORIZED, 'JwtService'));
+            expect(mockCollection.findOneAndDelete).not.toHaveBeenCalled();
+        });
     });
 
     describe('revokeToken', () => {
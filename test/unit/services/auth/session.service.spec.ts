@@ -44,21 +44,23 @@ describe('SessionService', () => {
     });
 
     describe('createSession', () => {
-        it('should call updateActivity with the user id', async () => {
+        it('should record the login in a single update', async () => {
             const user = { _id: new ObjectId("507f1f77bcf86cd799439011") } as any;
             const deviceInfo: Request['deviceInfo'] = { userAgent: 'Mozilla/5.0', ip: '127.0.0.1' };
 
-            const updateActivitySpy = jest
-                .spyOn(userRepository, 'updateActivity')
+            const updateLastLoginSpy = jest
+                .spyOn(userRepository, 'updateLastLogin')
                 .mockResolvedValue(undefined);
+            const updateActivitySpy = jest.spyOn(userRepository, 'updateActivity');
 
             await sessionService.createSession(user, deviceInfo);
 
-            expect(updateActivitySpy).toHaveBeenCalled();
-            expect(updateActivitySpy.mock.calls[0][0]).toBe(user._id.toString());
+            expect(updateLastLoginSpy).toHaveBeenCalledTimes(1);
+            expect(updateLastLoginSpy).toHaveBeenCalledWith(user._id, deviceInfo);
+            expect(updateActivitySpy).not.toHaveBeenCalled();
         });
 
-        it('should throw an ApiError if updateActivity fails', async () => {
+        it('should throw an ApiError if the update fails', async () => {
             const user = { _id: new ObjectId("507f1f77bcf86cd799439011") } as any;
             const deviceInfo: Request['deviceInfo'] = { userAgent: 'Mozilla/5.0', ip: '127.0.0.1' };
 
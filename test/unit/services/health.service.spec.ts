@@ -0,0 +1,35 @@
+import { HealthService } from '@gateway/services/health.service';
+
+jest.mock('@gateway/core/logger/winston.logger');
+
+describe('HealthService', () => {
+  let healthService: HealthService;
+
+  beforeEach(() => {
+    jest.useFakeTimers();
+    healthService = new HealthService();
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  describe('checkHealth', () => {
+    it('should reuse the snapshot within the cache window', async () => {
+      const first = await healthService.checkHealth();
+      jest.advanceTimersByTime(4999);
+      const second = await healthService.checkHealth();
+
+      expect(second).toBe(first);
+    });
+
+    it('should take a fresh snapshot once the cache window has passed', async () => {
+      const first = await healthService.checkHealth();
+      jest.advanceTimersByTime(5000);
+      const second = await healthService.checkHealth();
+
+      expect(second).not.toBe(first);
+      expect(new Date(second.timestamp).getTime() - new Date(first.timestamp).getTime()).toBe(5000);
+    });
+  });
+});
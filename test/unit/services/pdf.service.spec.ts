@@ -35,22 +35,30 @@ jest.mock('pdf-lib', () => {
   };
 });
 
+const mockContextClose = jest.fn().mockResolvedValue(undefined);
+const mockBrowserClose = jest.fn().mockResolvedValue(undefined);
+
 // Mock puppeteer
 jest.mock('puppeteer', () => ({
   launch: jest.fn().mockImplementation(() => ({
-    newPage: jest.fn().mockImplementation(() => ({
-      setContent: jest.fn().mockResolvedValue(undefined),
-      pdf: jest.fn().mockResolvedValue(Buffer.from([1, 2, 3])),
-      close: jest.fn().mockResolvedValue(undefined)
+    connected: true,
+    createBrowserContext: jest.fn().mockImplementation(() => ({
+      newPage: jest.fn().mockImplementation(() => ({
+        setContent: jest.fn().mockResolvedValue(undefined),
+        pdf: jest.fn().mockResolvedValue(Buffer.from([1, 2, 3])),
+        close: jest.fn().mockResolvedValue(undefined)
+      })),
+      close: mockContextClose
     })),
-    close: jest.fn().mockResolvedValue(undefined)
+    close: mockBrowserClose
   }))
 }));
 
 // Mock template service
 const mockTemplateService = {
   validateTemplate: jest.fn(),
-  renderTemplate: jest.fn()
+  renderTemplate: jest.fn(),
+  loadTemplate: jest.fn().mockResolvedValue('<html>{{test}}</html>')
 };
 
 describe('PDFService', () => {
@@ -99,6 +107,28 @@ describe('PDFService', () => {
 
       expect(mockTemplateService.renderTemplate).toHaveBeenCalledWith(templateName, data);
     });
+
+    it('should serve repeat requests from the cache', async () => {
+      mockTemplateService.validateTemplate.mockResolvedValue(true);
+      mockTemplateService.renderTemplate.mockResolvedValue('<html>test</html>');
+
+      const first = await pdfService.generatePDF(templateName, data);
+      const second = await pdfService.generatePDF(templateName, data);
+
+      expect(second).toBe(first);
+      expect(mockTemplateService.renderTemplate).toHaveBeenCalledTimes(1);
+    });
+
+    it('should render again once the template changes', async () => {
+      mockTemplateService.validateTemplate.mockResolvedValue(true);
+      mockTemplateService.renderTemplate.mockResolvedValue('<html>test</html>');
+
+      await pdfService.generatePDF(templateName, data);
+      mockTemplateService.loadTemplate.mockResolvedValueOnce('<html>edited {{test}}</html>');
+      await pdfService.generatePDF(templateName, data);
+
+      expect(mockTemplateService.renderTemplate).toHaveBeenCalledTimes(2);
+    });
   });
 
   describe('mergePDFs', () => {
@@ -148,5 +178,28 @@ describe('PDFService', () => {
       expect(puppeteer.launch).toHaveBeenCalled();
       expect(Buffer.isBuffer(result)).toBe(true);
     });
+
+    it('should render each document in its own browser context', async () => {
+      await pdfService.generateFromHTML('<html>one</html>');
+      await pdfService.generateFromHTML('<html>two</html>');
+
+      expect(puppeteer.launch).toHaveBeenCalledTimes(1);
+      expect(mockContextClose).toHaveBeenCalledTimes(2);
+    });
+  });
+
+  describe('close', () => {
+    it('should close the shared browser', async () => {
+      await pdfService.generateFromHTML('<html>test</html>');
+      await pdfService.close();
+
+      expect(mockBrowserClose).toHaveBeenCalledTimes(1);
+    });
+
+    it('should do nothing when no browser was launched', async () => {
+      await pdfService.close();
+
+      expect(mockBrowserClose).not.toHaveBeenCalled();
+    });
   });
 });
\ No newline at end of file
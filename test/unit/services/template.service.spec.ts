@@ -201,4 +201,25 @@ describe('TemplateService', () => {
       await expect(templateService.getTemplateVars('error')).rejects.toThrow();
     });
   });
+
+  describe('template source cache', () => {
+    it('should read each template from disk only once', async () => {
+      mockedReadFile.mockResolvedValue('<p>{{name}}</p>');
+
+      await templateService.validateTemplate('cached');
+      const result = await templateService.renderTemplate('cached', { name: 'John' });
+
+      expect(result).toBe('<p>John</p>');
+      expect(mockedReadFile).toHaveBeenCalledTimes(1);
+    });
+
+    it('should not cache a failed read', async () => {
+      mockedReadFile.mockRejectedValueOnce(new Error('File not found'));
+      mockedReadFile.mockResolvedValueOnce('<p>added later</p>');
+
+      expect(await templateService.validateTemplate('late')).toBe(false);
+      expect(await templateService.validateTemplate('late')).toBe(true);
+      expect(mockedReadFile).toHaveBeenCalledTimes(2);
+    });
+  });
 });
\ No newline at end of file
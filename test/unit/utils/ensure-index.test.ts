@@ -0,0 +1,28 @@
+import { Collection } from 'mongodb';
+import { ensureIndex } from '@gateway/utils/ensureIndex';
+
+const mockCollection = (namespace: string, createIndex: jest.Mock) =>
+    ({ namespace, createIndex }) as unknown as Collection;
+
+describe('ensureIndex', () => {
+    it('should send each spec once per namespace across collection handles', async () => {
+        const createIndex = jest.fn().mockResolvedValue('name_1');
+
+        await ensureIndex(mockCollection('test.shared', createIndex), { name: 1 });
+        await ensureIndex(mockCollection('test.shared', createIndex), { name: 1 });
+        await ensureIndex(mockCollection('test.other', createIndex), { name: 1 });
+
+        expect(createIndex).toHaveBeenCalledTimes(2);
+    });
+
+    it('should retry a spec whose creation failed', async () => {
+        const createIndex = jest.fn()
+            .mockRejectedValueOnce(new Error('index build failed'))
+            .mockResolvedValueOnce('name_1');
+        const collection = mockCollection('test.retry', createIndex);
+
+        await expect(ensureIndex(collection, { name: 1 })).rejects.toThrow('index build failed');
+        await expect(ensureIndex(collection, { name: 1 })).resolves.toBe('name_1');
+        expect(createIndex).toHaveBeenCalledTimes(2);
+    });
+});
@@ -1,5 +1,5 @@
 import { MongoClient } from 'mongodb';
-import { MongoConnection, getMongoConnection } from '../../../src/utils/mongoConnection';
+import { MongoConnection, getMongoConnection, MONGO_POOL_OPTIONS } from '../../../src/utils/mongoConnection';
 import { WinstonLogger } from '@gateway/core/logger/winston.logger';
 
 // Mock mongodb
@@ -96,13 +96,20 @@ describe('MongoConnection', () => {
         it('should connect successfully with auth', async () => {
             await mongoConnection.connect();
             
-            expect(MockedMongoClient).toHaveBeenCalledWith(MONGO_TEST_URI);
+            expect(MockedMongoClient).toHaveBeenCalledWith(MONGO_TEST_URI, MONGO_POOL_OPTIONS);
             expect(mockClient.connect).toHaveBeenCalled();
             expect(mockLogger.info).toHaveBeenCalledWith('Connected to MongoDB');
             expect(mongoConnection.isConnected()).toBe(true);
         });
 
 
+        it('should share a single client between concurrent connects', async () => {
+            await Promise.all([mongoConnection.connect(), mongoConnection.connect()]);
+
+            expect(MockedMongoClient).toHaveBeenCalledTimes(1);
+            expect(mockClient.connect).toHaveBeenCalledTimes(1);
+        });
+
         it('should handle connection failure', async () => {
             const error = new Error('Connection failed');
             mockClient.connect.mockRejectedValueOnce(error);
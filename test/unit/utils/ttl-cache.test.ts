@@ -0,0 +1,31 @@
+import { TtlCache } from '@gateway/utils/ttlCache';
+
+describe('TtlCache', () => {
+    afterEach(() => {
+        jest.useRealTimers();
+    });
+
+    it('should return stored values until they expire', () => {
+        jest.useFakeTimers();
+        const cache = new TtlCache<string, number>(1000, 10);
+
+        cache.set('a', 1);
+        expect(cache.get('a')).toBe(1);
+
+        jest.advanceTimersByTime(1001);
+        expect(cache.get('a')).toBeUndefined();
+    });
+
+    it('should evict the least recently used entry when full', () => {
+        const cache = new TtlCache<string, number>(60000, 2);
+
+        cache.set('a', 1);
+        cache.set('b', 2);
+        cache.get('a');
+        cache.set('c', 3);
+
+        expect(cache.get('a')).toBe(1);
+        expect(cache.get('b')).toBeUndefined();
+        expect(cache.get('c')).toBe(3);
+    });
+});